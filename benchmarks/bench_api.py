@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+# end to end throughput of grid against benchmarks/fake_smartsheet.py (started in its own process so it doesn't share
+# the gil with the client): full fetch, paged fetch, upsert (update_rows), bulk post (post_new_rows), write_dataframe and delete_all_rows,
+# with rows/sec, peak rss growth, requests/retries per operation and the errors the fake injected
+# usage: python benchmarks/bench_api.py [--rows 20000] [--columns 150] [--latency 0.05] [--rate-limit 0.01] [--server-errors 0.01]
+#        [--rpm 300] (grid's request rate, raise it to take the limiter out of the numbers)
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import grid as grid_module
+from grid import grid
+import fake_smartsheet
+
+
+class PeakRSS:
+    '''samples this process's resident memory every few ms while the block runs, .peak_mb is the growth over the start'''
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak_mb = 0.0
+
+    def _rss(self):
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            # no /proc (macos), ru_maxrss is the lifetime peak (kb on linux, bytes on macos)
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    def _sample(self):
+        while not self.done.wait(self.interval):
+            self.peak = max(self.peak, self._rss())
+
+    def __enter__(self):
+        self.start = self.peak = self._rss()
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.done.set()
+        self.thread.join()
+        self.peak = max(self.peak, self._rss())
+        self.peak_mb = (self.peak - self.start) / 2**20
+
+
+def server_stats(api_base):
+    with urllib.request.urlopen(api_base.replace("/2.0", "/_fake/stats")) as response:
+        return json.loads(response.read())
+
+
+def measure(name, g, rows, func, api_base):
+    '''runs func once and prints one line: seconds, rows/sec, peak rss growth, requests, retries and injected errors'''
+    calls_before = sum(stats["calls"] for stats in g.call_stats.values())
+    retries_before = sum(stats["retries"] for stats in g.call_stats.values())
+    injected_before = sum(server_stats(api_base)["injected"].values())
+    start = time.perf_counter()
+    with PeakRSS() as memory:
+        func()
+    seconds = time.perf_counter() - start
+    requests = sum(stats["calls"] for stats in g.call_stats.values()) - calls_before
+    retries = sum(stats["retries"] for stats in g.call_stats.values()) - retries_before
+    injected = sum(server_stats(api_base)["injected"].values()) - injected_before
+    print(f"{name:<16}{rows:>9} rows {seconds:>9.2f}s {rows / seconds:>11.0f} rows/s {memory.peak_mb:>9.1f} MB "
+          f"{requests:>6} requests {retries:>5} retries {injected:>5} injected")
+
+
+def posting_rows(g, n_rows, start, existing=0):
+    '''posting_data for update_rows/post_new_rows: the first `existing` rows reuse keys already on the sheet, the rest are new'''
+    column_df = g.get_column_df()
+    # formula columns can't take values
+    formulas = set(column_df.loc[column_df["formula"].notna(), "title"]) if "formula" in column_df else set()
+    columns = [(title, column_type) for title, column_type in zip(column_df["title"], column_df["type"])
+               if title != "Key" and title not in formulas]
+    rows = []
+    for i in range(n_rows):
+        key = g.df["Key"].iloc[i] if i < existing else f"new-{start + i}"
+        row = {"Key": key}
+        for title, column_type in columns:
+            if column_type == "DATE":
+                row[title] = f"2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}"
+            elif column_type == "CHECKBOX":
+                row[title] = "true" if i % 2 else "false"
+            elif column_type == "PICKLIST":
+                row[title] = fake_smartsheet.PICKLIST_OPTIONS[i % len(fake_smartsheet.PICKLIST_OPTIONS)]
+            else:
+                row[title] = f"bench {i}"
+        rows.append(row)
+    return rows
+
+
+def edited_frame(g, n_changed, n_new):
+    '''the fetched df with one text cell changed on n_changed rows and n_new new rows under it, for write_dataframe'''
+    column_df = g.get_column_df()
+    text = [title for title, column_type in zip(column_df["title"], column_df["type"])
+            if column_type == "TEXT_NUMBER" and title != "Key" and title not in g._read_only_columns()][0]
+    frame = g.df.astype(object)
+    step = max(1, len(frame) // max(1, n_changed))
+    frame.loc[frame.index[::step][:n_changed], text] = "edited"
+    return grid_module.pd.concat([frame, grid_module.pd.DataFrame(posting_rows(g, n_new, len(frame)))], ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=150)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--server-errors", type=float, default=0.0)
+    parser.add_argument("--rpm", type=int, default=300, help="grid's requests per minute (the real api allows 300)")
+    parser.add_argument("--write-rows", type=int, default=None, help="rows per upsert/bulk post (default: rows // 4)")
+    args = parser.parse_args()
+    write_rows = args.write_rows or max(1, args.rows // 4)
+
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(target=fake_smartsheet.serve, daemon=True, kwargs=dict(
+        ready=ready, rows=args.rows, columns=args.columns, latency=args.latency,
+        rate_limit=args.rate_limit, server_errors=args.server_errors))
+    server.start()
+    api_base = f"http://127.0.0.1:{ready.get(timeout=30)}/2.0"
+
+    grid.api_base = api_base
+    grid._rate_limiter = grid_module._RateLimiter(args.rpm)
+    print(f"{args.rows} x {args.columns} sheet, latency {args.latency}s, 429 {args.rate_limit:.1%}, 5xx {args.server_errors:.1%}, {args.rpm} requests/min")
+    # the table already counts retries, keep the sdk's error logs and grid's retry warnings out of it
+    logging.getLogger("smartsheet").setLevel(logging.CRITICAL)
+    logging.getLogger(grid_module.__name__).setLevel(logging.ERROR)
+    # load pandas/smartsheet (imported lazily by grid) before anything is timed
+    grid_module.pd.DataFrame, grid_module.smartsheet.models
+    try:
+        g = grid(1, token="benchmark")
+        measure("fetch_content", g, args.rows, g.fetch_content, api_base)
+        paged = grid(1, token="benchmark")
+        measure("fetch (paged)", paged, args.rows, lambda: paged.fetch_content(page_size=5000), api_base)
+        typed = grid(1, token="benchmark", typed=True)
+        measure("fetch (typed)", typed, args.rows, typed.fetch_content, api_base)
+
+        # half the upsert hits existing rows, half is new
+        upsert = posting_rows(g, write_rows, 0, existing=write_rows // 2)
+        measure("upsert (batch)", g, write_rows, lambda: g.update_rows(upsert, "Key", update_type="batch"), api_base)
+        bulk = posting_rows(g, write_rows, write_rows)
+        measure("post_new_rows", g, write_rows, lambda: g.post_new_rows(bulk), api_base)
+        # the whole sheet written back with 1% of the rows edited and 1% new, only those should go out
+        g.fetch_content()
+        frame = edited_frame(g, len(g.df) // 100, len(g.df) // 100)
+        measure("write_dataframe", g, len(frame), lambda: g.write_dataframe(frame, key="Key"), api_base)
+        print(" " * 16, g.write_summary)
+        total = len(g.fetch_row_ids())
+        measure("delete_all_rows", g, total, g.delete_all_rows, api_base)
+        print("server:", server_stats(api_base))
+    finally:
+        server.terminate()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+# compares the old per-cell date handling (is_date_like + parse_to_iso8601 on every value) with
+# grid._coerce_dates (only DATE/DATETIME columns, one pd.to_datetime per column) on synthetic posting data
+# usage: python benchmarks/bench_date_coercion.py [rows] [columns]
+
+import sys
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+from grid import grid
+
+
+def make_posting_data(n_rows, n_columns):
+    '''posting_data with every 5th column a DATE column, the rest text/numbers (some of which dateutil would call dates)'''
+    columns = [{"id": 1000 + j, "title": f"col {j}", "type": "DATE" if j % 5 == 0 else "TEXT_NUMBER"} for j in range(n_columns)]
+    samples = ["Open", "May", "3-4", "1200", "north yard", "12.5"]
+    posting_data = []
+    for i in range(n_rows):
+        row = {}
+        for j, column in enumerate(columns):
+            if column["type"] == "DATE":
+                row[column["title"]] = f"{(i % 12) + 1}/{(i % 28) + 1}/2025"
+            else:
+                row[column["title"]] = samples[(i + j) % len(samples)]
+        posting_data.append(row)
+    return columns, posting_data
+
+
+def legacy(g, posting_data):
+    '''what post_new_rows/update_rows did to every cell before building the payload'''
+    for item in posting_data:
+        for key in item:
+            if g.is_date_like(item[key]):
+                item[key] = g.parse_to_iso8601(item[key])
+    return posting_data
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    columns, posting_data = make_posting_data(n_rows, n_columns)
+    g = grid(0, token="benchmark")
+    g._cache_schema(columns)
+
+    start = time.perf_counter()
+    legacy(g, [dict(row) for row in posting_data])
+    old = time.perf_counter() - start
+
+    start = time.perf_counter()
+    g._coerce_dates(posting_data)
+    new = time.perf_counter() - start
+
+    print(f"{n_rows} rows x {n_columns} columns")
+    print(f"is_date_like + parse_to_iso8601  {old:8.3f}s")
+    print(f"_coerce_dates                    {new:8.3f}s  ({old / new:.1f}x)")
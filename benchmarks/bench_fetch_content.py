@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+# compares the old fetch_content path (sdk models -> to_dict -> cell by cell loop) with
+# grid._build_df on the plain json the passthrough returns, using a synthetic get_sheet response
+# usage: python benchmarks/bench_fetch_content.py [rows] [columns]
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import smartsheet
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+from grid import grid
+
+COLUMN_TYPES = ["TEXT_NUMBER", "TEXT_NUMBER", "DATE", "CHECKBOX", "PICKLIST"]
+
+
+def make_sheet(n_rows, n_columns):
+    '''a get_sheet style response with a mix of text, number, date, checkbox and picklist columns'''
+    columns = [{"id": 1000 + j, "title": f"col {j}", "type": COLUMN_TYPES[j % len(COLUMN_TYPES)]} for j in range(n_columns)]
+    rows = []
+    for i in range(n_rows):
+        cells = []
+        for j, column in enumerate(columns):
+            kind = j % len(COLUMN_TYPES)
+            if kind == 0:
+                cells.append({"columnId": column["id"], "value": f"text {i}", "displayValue": f"text {i}"})
+            elif kind == 1:
+                cells.append({"columnId": column["id"], "value": float(i), "displayValue": str(i)})
+            elif kind == 2:
+                cells.append({"columnId": column["id"], "value": "2025-07-23", "displayValue": "07/23/25"})
+            elif kind == 3:
+                cells.append({"columnId": column["id"], "value": i % 2 == 0})
+            else:
+                cells.append({"columnId": column["id"], "value": "Open", "displayValue": "Open"})
+        rows.append({"id": i, "cells": cells})
+    return {"columns": columns, "rows": rows}
+
+
+def legacy(content):
+    '''the fetch_content loop as it was before the columnar builder'''
+    grid_columns = [i.get("title") for i in content.get("columns")]
+    grid_rows = []
+    for i in content.get("rows"):
+        b = i.get("cells")
+        c = []
+        for i in b:
+            l = i.get("displayValue")
+            m = i.get("value")
+            if l == None:
+                c.append(m)
+            else:
+                c.append(l)
+        grid_rows.append(c)
+    df = pd.DataFrame(grid_rows, columns=grid_columns)
+    df["id"] = [i.get("id") for i in content.get("rows")]
+    return df
+
+
+def legacy_sdk(content):
+    '''the whole old path: sdk model objects from the parsed json, .to_dict() back out, then the loop'''
+    return legacy(smartsheet.models.Sheet(content).to_dict())
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 15000
+    n_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    content = make_sheet(n_rows, n_columns)
+    g = grid(0, token="benchmark")
+
+    # the sdk models are slow enough that the full sheet would take minutes, time a slice and scale it
+    sdk_rows = min(n_rows, 500)
+    sdk_content = {"columns": content["columns"], "rows": content["rows"][:sdk_rows]}
+    sdk = best_of(lambda: legacy_sdk(sdk_content), repeat=1) * n_rows / sdk_rows
+    old = best_of(lambda: legacy(content))
+    new = best_of(lambda: g._build_df(content["rows"], content["columns"]))
+    typed = best_of(lambda: g._build_df(content["rows"], content["columns"], typed=True))
+
+    print(f"{n_rows} rows x {n_columns} columns")
+    print(f"models + to_dict + loop {sdk:8.3f}s  (scaled from {sdk_rows} rows)")
+    print(f"legacy loop          {old:8.3f}s")
+    print(f"_build_df            {new:8.3f}s  ({old / new:.1f}x)")
+    print(f"_build_df(typed)     {typed:8.3f}s  ({old / typed:.1f}x)")
+    print(f"passthrough json + _build_df vs the sdk path: {sdk / new:.1f}x")
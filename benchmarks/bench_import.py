@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+# cold start: fresh interpreter per run, timing `import grid`, grid(...) and the first touch of the sdk client,
+# against importing pandas/smartsheet/dateutil up front the way grid.py used to
+# usage: python benchmarks/bench_import.py [runs]
+
+import sys
+import subprocess
+import statistics
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+LAZY = f'''
+import sys, time
+sys.path.insert(0, {str(REPO)!r})
+t0 = time.perf_counter()
+from grid import grid
+t1 = time.perf_counter()
+g = grid(0, token="benchmark")
+t2 = time.perf_counter()
+g.smart
+t3 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2)
+'''
+
+EAGER = '''
+import time
+t0 = time.perf_counter()
+import pandas, smartsheet, dateutil.parser
+print(time.perf_counter() - t0)
+'''
+
+
+def run(code, runs):
+    '''median of each printed timing over runs fresh interpreters'''
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        samples.append([float(x) for x in out.split()])
+    return [statistics.median(column) for column in zip(*samples)]
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    import_seconds, init_seconds, client_seconds = run(LAZY, runs)
+    (eager_seconds,) = run(EAGER, runs)
+    print(f"median of {runs} fresh interpreters")
+    print(f"import grid:                             {import_seconds * 1000:8.1f} ms")
+    print(f"grid(0, token=...):                      {init_seconds * 1000:8.1f} ms")
+    print(f"first .smart (loads smartsheet):         {client_seconds * 1000:8.1f} ms")
+    print(f"import pandas, smartsheet, dateutil:     {eager_seconds * 1000:8.1f} ms  (what importing grid.py used to cost)")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+# compares building write payloads the old way (a smartsheet.models.Row + Cell per cell, serialized by the sdk the way
+# Sheets.update_rows does it) with grid._row_payloads (plain dicts, one json.dumps) on synthetic update data
+# usage: python benchmarks/bench_payload.py [rows] [columns]
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import smartsheet
+from smartsheet.util import serialize
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+import grid as grid_module
+from grid import grid
+
+COLUMN_TYPES = ["TEXT_NUMBER", "TEXT_NUMBER", "DATE", "CHECKBOX", "TEXT_NUMBER"]
+
+
+def make_data(n_rows, n_columns):
+    '''columns (get_columns style) and one update dict per row: text, numbers, iso dates, checkboxes, formulas and blanks'''
+    columns = [{"id": 1000 + j, "title": f"col {j}", "type": COLUMN_TYPES[j % len(COLUMN_TYPES)]} for j in range(n_columns)]
+    posting_data = []
+    for i in range(n_rows):
+        row = {}
+        for j, column in enumerate(columns):
+            kind = j % len(COLUMN_TYPES)
+            if i % 10 == j % 10:
+                row[column["title"]] = None
+            elif kind == 0:
+                row[column["title"]] = f"text {i}"
+            elif kind == 1:
+                row[column["title"]] = float(i)
+            elif kind == 2:
+                row[column["title"]] = "2025-07-23"
+            elif kind == 3:
+                row[column["title"]] = i % 2 == 0
+            else:
+                row[column["title"]] = f"=[col 1]{i + 1} * 2"
+        posting_data.append(row)
+    return columns, posting_data
+
+
+def legacy(posting_data, column_ids, row_ids):
+    '''the update_rows default branch as it was: one Row and one Cell model per cell, attributes set one at a time'''
+    rows = []
+    for row_id, data in zip(row_ids, posting_data):
+        new_row = smartsheet.models.Row()
+        new_row.id = row_id
+        for column_name, column_id in column_ids.items():
+            new_cell = smartsheet.models.Cell()
+            new_cell.column_id = int(column_id)
+            value = data.get(column_name)
+            if value != None:
+                if isinstance(value, str) and value.startswith("="):
+                    new_cell.formula = value
+                else:
+                    new_cell.value = value
+            else:
+                new_cell.value = ""
+            new_cell.strict = False
+            new_row.cells.append(new_cell)
+        rows.append(new_row)
+    return rows
+
+
+def legacy_body(rows):
+    '''what the sdk does with them on the way out: serialize() walks every model, then requests dumps the result'''
+    return json.dumps(serialize(rows))
+
+
+def new_body(rows):
+    '''what _rows_request sends: the body _chunk_rows joins from the one dumps per row it sizes the chunk with'''
+    return "[" + ",".join(json.dumps(row, default=grid_module._json_default) for row in rows) + "]"
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    columns, posting_data = make_data(n_rows, n_columns)
+    column_ids = {column["title"]: column["id"] for column in columns}
+    row_ids = list(range(1, n_rows + 1))
+    g = grid(0, token="benchmark")
+    # _row_payloads coerces dates off the column types, seed the schema cache instead of asking the api
+    g._cache_schema(columns)
+
+    # the models are slow enough that the full set would take a while, time a slice and scale it
+    sdk_rows = min(n_rows, 2000)
+    scale = n_rows / sdk_rows
+    old_build, old_rows = best_of(lambda: legacy(posting_data[:sdk_rows], column_ids, row_ids[:sdk_rows]), repeat=1)
+    old_send, old_json = best_of(lambda: legacy_body(old_rows), repeat=1)
+    old_build, old_send = old_build * scale, old_send * scale
+    new_build, new_rows = best_of(lambda: g._row_payloads(posting_data, column_ids, row_ids=row_ids, clear_blanks=True, strict=False))
+    new_send, new_json = best_of(lambda: new_body(new_rows))
+    assert json.loads(old_json) == new_rows[:sdk_rows], "the two paths should send the same rows"
+
+    cells = n_rows * n_columns
+    print(f"{n_rows} rows x {n_columns} columns ({cells} cells)")
+    print(f"Row/Cell models   build {old_build:7.3f}s  serialize {old_send:7.3f}s  ({cells / (old_build + old_send):9.0f} cells/s, scaled from {sdk_rows} rows)")
+    print(f"_row_payloads     build {new_build:7.3f}s  serialize {new_send:7.3f}s  ({cells / (new_build + new_send):9.0f} cells/s)")
+    print(f"speedup: {(old_build + old_send) / (new_build + new_send):.1f}x")
@@ -0,0 +1,415 @@
+#!/usr/bin/env python
+
+# a local stand in for the parts of the smartsheet api grid.py uses, served over http so the real sdk, requests session,
+# rate limiter and retries are all in the loop:
+#   GET    /2.0/sheets/{id}                 (pageSize, page, rowIds, columnIds, filterId, rowsModifiedSince, exclude=nonexistentCells)
+#   GET    /2.0/sheets/{id}/version
+#   GET    /2.0/sheets/{id}/columns
+#   POST   /2.0/sheets/{id}/rows            add rows
+#   PUT    /2.0/sheets/{id}/rows            update rows
+#   DELETE /2.0/sheets/{id}/rows?ids=...    delete rows
+#   GET/POST/PUT /2.0/sheets/{id}/summary/fields
+#   GET    /_fake/stats                     request counts per route and status, injected errors
+# sheets are generated on first touch from the server's rows/columns settings, the column types cycle through
+# TEXT_NUMBER, DATE, PICKLIST, CHECKBOX, a numeric TEXT_NUMBER and a formula column
+# usage: python benchmarks/fake_smartsheet.py [--port 8765] [--rows 20000] [--columns 150] [--latency 0.05] [--rate-limit 0.01] [--server-errors 0.01]
+# then point grid at it: grid.api_base = "http://127.0.0.1:8765/2.0"
+
+import argparse
+import datetime
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+COLUMN_TYPES = ["TEXT_NUMBER", "DATE", "PICKLIST", "CHECKBOX", "TEXT_NUMBER", "FORMULA"]
+PICKLIST_OPTIONS = ["Open", "In Progress", "Blocked", "Done"]
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeSheet:
+    '''one sheet's columns, rows, summary fields and version, all behind one lock'''
+
+    def __init__(self, sheet_id, n_rows, n_columns, seed=0):
+        self.id = sheet_id
+        self.lock = threading.Lock()
+        self.version = 1
+        self.modified_at = _now()
+        self.row_ids = itertools.count(4_000_000_000_000 + sheet_id * 1_000_000_000)
+        self.summary_ids = itertools.count(7_000_000_000_000)
+        self.summary = []
+        # saved filters, {filter id: predicate on a row}, set by tests: get sheet with filterId marks the rows it rejects filteredOut
+        self.filters = {}
+        self.columns = []
+        for j in range(n_columns):
+            column_type = "TEXT_NUMBER" if j == 0 else COLUMN_TYPES[j % len(COLUMN_TYPES)]
+            column = {"id": 6_000_000_000_000 + j, "index": j, "title": "Key" if j == 0 else f"col {j}",
+                      "type": "TEXT_NUMBER" if column_type == "FORMULA" else column_type,
+                      "primary": j == 0, "width": 150, "validation": False, "version": 0}
+            if column_type == "PICKLIST":
+                column["options"] = PICKLIST_OPTIONS
+            if column_type == "FORMULA":
+                # the api hands a column formula back as its text
+                column["formula"] = f"=[col {j - 1}]@row * 2"
+            self.columns.append(column)
+        rng = random.Random(seed)
+        self.rows = [self._new_row([self._generated_cell(column, i, rng) for column in self.columns]) for i in range(n_rows)]
+
+    def _generated_cell(self, column, i, rng):
+        column_id, column_type = column["id"], column["type"]
+        if column["index"] == 0:
+            return {"columnId": column_id, "value": f"key-{i}", "displayValue": f"key-{i}"}
+        if column.get("formula"):
+            value = rng.randint(0, 1000)
+            return {"columnId": column_id, "value": value, "displayValue": str(value), "formula": column["formula"]}
+        if column_type == "DATE":
+            day = datetime.date(2024, 1, 1) + datetime.timedelta(days=rng.randint(0, 700))
+            return {"columnId": column_id, "value": day.isoformat(), "displayValue": day.strftime("%m/%d/%y")}
+        if column_type == "PICKLIST":
+            option = rng.choice(PICKLIST_OPTIONS)
+            return {"columnId": column_id, "value": option, "displayValue": option}
+        if column_type == "CHECKBOX":
+            return {"columnId": column_id, "value": rng.random() < 0.5}
+        if column["index"] % len(COLUMN_TYPES) == 4:
+            value = round(rng.uniform(0, 10000), 2)
+            return {"columnId": column_id, "value": value, "displayValue": str(value)}
+        if rng.random() < 0.1:
+            # some blanks, the api leaves value/displayValue out of empty cells
+            return {"columnId": column_id}
+        text = f"text {rng.randint(0, 99999)}"
+        return {"columnId": column_id, "value": text, "displayValue": text}
+
+    def _new_row(self, cells):
+        return {"id": next(self.row_ids), "createdAt": self.modified_at, "modifiedAt": self.modified_at, "cells": cells}
+
+    def _touch(self):
+        self.version += 1
+        self.modified_at = _now()
+
+    def _stored_cell(self, cell):
+        '''a cell from a write request as the api would hand it back'''
+        column_id = cell.get("columnId")
+        if cell.get("formula"):
+            return {"columnId": column_id, "formula": cell["formula"], "value": 0, "displayValue": "0"}
+        value = cell.get("value")
+        if value is None or value == "":
+            return {"columnId": column_id}
+        stored = {"columnId": column_id, "value": value}
+        if not isinstance(value, bool):
+            stored["displayValue"] = str(value)
+        return stored
+
+    def get(self, query):
+        with self.lock:
+            rows = self.rows
+            if "rowsModifiedSince" in query:
+                since = query["rowsModifiedSince"]
+                rows = [row for row in rows if row["modifiedAt"] >= since]
+            if "rowIds" in query:
+                wanted = set(int(row_id) for row_id in query["rowIds"].split(","))
+                rows = [row for row in rows if row["id"] in wanted]
+            if "filterId" in query:
+                # like the api, the rows the filter hides still come back (and count), just marked filteredOut
+                shown = self.filters.get(int(query["filterId"]), lambda row: True)
+                rows = [row if shown(row) else dict(row, filteredOut=True) for row in rows]
+            total = len(rows)
+            if "pageSize" in query:
+                page_size = int(query["pageSize"])
+                page = int(query.get("page", 1))
+                rows = rows[(page - 1) * page_size:page * page_size]
+            columns = self.columns
+            if "columnIds" in query:
+                wanted = set(int(column_id) for column_id in query["columnIds"].split(","))
+                columns = [column for column in columns if column["id"] in wanted]
+                rows = [dict(row, cells=[cell for cell in row["cells"] if cell["columnId"] in wanted]) for row in rows]
+            if query.get("exclude") == "nonexistentCells":
+                rows = [dict(row, cells=[cell for cell in row["cells"] if "value" in cell]) for row in rows]
+            return {"id": self.id, "name": f"fake sheet {self.id}", "permalink": f"https://fake/sheets/{self.id}",
+                    "version": self.version, "modifiedAt": self.modified_at, "totalRowCount": total,
+                    "columns": columns, "rows": [dict(row, rowNumber=i + 1) for i, row in enumerate(rows)]}
+
+    def add_rows(self, rows):
+        with self.lock:
+            self._touch()
+            by_column = {column["id"]: column for column in self.columns}
+            added = []
+            for row in rows:
+                given = {cell.get("columnId"): self._stored_cell(cell) for cell in row.get("cells", [])}
+                cells = [given.get(column_id, {"columnId": column_id}) for column_id in by_column]
+                added.append(self._new_row(cells))
+            for row in added:
+                row["modifiedAt"] = self.modified_at
+            top = [row for row, request in zip(added, rows) if request.get("toTop")]
+            bottom = [row for row, request in zip(added, rows) if not request.get("toTop")]
+            self.rows = top + self.rows + bottom
+            return added
+
+    def update_rows(self, rows):
+        with self.lock:
+            position = {row["id"]: i for i, row in enumerate(self.rows)}
+            missing = [row.get("id") for row in rows if row.get("id") not in position]
+            if missing:
+                return None, missing
+            self._touch()
+            updated = []
+            for request in rows:
+                row = self.rows[position[request["id"]]]
+                index = {cell["columnId"]: i for i, cell in enumerate(row["cells"])}
+                for cell in request.get("cells", []):
+                    if cell.get("columnId") in index:
+                        row["cells"][index[cell["columnId"]]] = self._stored_cell(cell)
+                row["modifiedAt"] = self.modified_at
+                updated.append(row)
+            return updated, []
+
+    def delete_rows(self, ids, ignore_missing=False):
+        '''(deleted ids, missing ids), nothing is deleted when ids are missing unless ignore_missing (ignoreRowsNotFound=true)'''
+        with self.lock:
+            present = set(row["id"] for row in self.rows)
+            missing = [row_id for row_id in ids if row_id not in present]
+            if missing and not ignore_missing:
+                return None, missing
+            self._touch()
+            doomed = set(ids)
+            self.rows = [row for row in self.rows if row["id"] not in doomed]
+            return [row_id for row_id in ids if row_id in present], missing
+
+    def add_summary_fields(self, fields):
+        with self.lock:
+            added = []
+            for field in fields:
+                added.append({"id": next(self.summary_ids), "title": field.get("title"), "type": field.get("type", "TEXT_NUMBER"),
+                              "index": len(self.summary), "locked": False, "lockedForUser": False})
+                self.summary.append(added[-1])
+            return added
+
+    def update_summary_fields(self, fields):
+        with self.lock:
+            by_id = {field["id"]: field for field in self.summary}
+            updated = []
+            for field in fields:
+                stored = by_id.get(field.get("id"))
+                if stored is None:
+                    continue
+                value = field.get("objectValue", field.get("ObjectValue"))
+                stored["objectValue"] = value
+                stored["displayValue"] = str(value) if value is not None else None
+                stored["modifiedAt"] = _now()
+                updated.append(stored)
+            return updated
+
+
+class FakeSmartsheet:
+    '''the server side state: sheets made on first touch, request counters, and the knobs for latency and injected errors
+    latency = seconds added to every response, rate_limit = share of requests answered 429 (Retry-After: retry_after),
+    server_errors = share answered with a 500/502/503
+    faults = scripted failures for tests, {(route name, nth request to it): (status, applied)}: that request is answered with
+    status, and with applied=True the write goes through first (a request that worked but whose answer never made it back)'''
+
+    def __init__(self, rows=20000, columns=150, latency=0.0, rate_limit=0.0, server_errors=0.0, retry_after=1, seed=0, faults=None):
+        self.n_rows = rows
+        self.n_columns = columns
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.server_errors = server_errors
+        self.retry_after = retry_after
+        self.seed = seed
+        self.sheets = {}
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        self.injected = Counter()
+        self.faults = dict(faults or {})
+        self.route_calls = Counter()
+        self.random = random.Random(seed)
+
+    def sheet(self, sheet_id):
+        with self.lock:
+            if sheet_id not in self.sheets:
+                self.sheets[sheet_id] = FakeSheet(sheet_id, self.n_rows, self.n_columns, self.seed + sheet_id)
+            return self.sheets[sheet_id]
+
+    def injected_error(self):
+        '''(status, error code, message, headers) for a request that should fail, None otherwise'''
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.rate_limit:
+            self.injected["429"] += 1
+            return 429, 4003, "Rate limit exceeded.", {"Retry-After": str(self.retry_after)}
+        if roll < self.rate_limit + self.server_errors:
+            status, code, message = self.random.choice([(500, 4000, "An unexpected error has occurred."),
+                                                        (502, 4001, "Smartsheet.com is currently offline for system maintenance."),
+                                                        (503, 4002, "Server timeout exceeded. Request has failed.")])
+            self.injected[str(status)] += 1
+            return status, code, message, {}
+        return None
+
+    def scripted_fault(self, name):
+        '''(status, applied) if this request to route name is one of the faults, None otherwise'''
+        with self.lock:
+            self.route_calls[name] += 1
+            return self.faults.pop((name, self.route_calls[name]), None)
+
+    def stats(self):
+        with self.lock:
+            return {"requests": dict(self.requests), "injected": dict(self.injected),
+                    "total_requests": sum(self.requests.values())}
+
+
+ROUTES = [
+    ("GET", re.compile(r"^/2\.0/sheets/(\d+)$"), "get_sheet"),
+    ("GET", re.compile(r"^/2\.0/sheets/(\d+)/version$"), "get_sheet_version"),
+    ("GET", re.compile(r"^/2\.0/sheets/(\d+)/columns$"), "get_columns"),
+    ("POST", re.compile(r"^/2\.0/sheets/(\d+)/rows$"), "add_rows"),
+    ("PUT", re.compile(r"^/2\.0/sheets/(\d+)/rows$"), "update_rows"),
+    ("DELETE", re.compile(r"^/2\.0/sheets/(\d+)/rows$"), "delete_rows"),
+    ("GET", re.compile(r"^/2\.0/sheets/(\d+)/summary/fields$"), "get_summary_fields"),
+    ("POST", re.compile(r"^/2\.0/sheets/(\d+)/summary/fields$"), "add_summary_fields"),
+    ("PUT", re.compile(r"^/2\.0/sheets/(\d+)/summary/fields$"), "update_summary_fields"),
+]
+
+
+def make_handler(api):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, status, code, message, headers=None):
+            self._send(status, {"errorCode": code, "message": message, "refId": "fake"}, headers)
+
+        def _handle(self, method):
+            url = urlparse(self.path)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+
+            if url.path == "/_fake/stats":
+                return self._send(200, api.stats())
+            for route_method, pattern, name in ROUTES:
+                match = pattern.match(url.path)
+                if route_method == method and match:
+                    break
+            else:
+                return self._error(404, 1006, "Not Found")
+
+            if api.latency:
+                time.sleep(api.latency)
+            error = api.injected_error()
+            if error:
+                status, code, message, headers = error
+                with api.lock:
+                    api.requests[f"{name} {status}"] += 1
+                return self._error(status, code, message, headers)
+            fault = api.scripted_fault(name)
+            if fault:
+                status, applied = fault
+                if applied:
+                    self._respond(name, api.sheet(int(match.group(1))), query, body)
+                with api.lock:
+                    api.requests[f"{name} {status}"] += 1
+                return self._error(status, 4000, "Scripted failure.")
+            with api.lock:
+                api.requests[f"{name} 200"] += 1
+
+            status, payload = self._respond(name, api.sheet(int(match.group(1))), query, body)
+            if status != 200:
+                return self._error(status, payload["errorCode"], payload["message"])
+            return self._send(status, payload)
+
+        def _respond(self, name, sheet, query, body):
+            '''carries out one routed request, returns (status, payload)'''
+            if name == "get_sheet":
+                return 200, sheet.get(query)
+            if name == "get_sheet_version":
+                return 200, {"version": sheet.version}
+            if name == "get_columns":
+                return 200, {"pageNumber": 1, "pageSize": len(sheet.columns), "totalPages": 1,
+                             "totalCount": len(sheet.columns), "data": sheet.columns}
+            if name == "get_summary_fields":
+                return 200, {"pageNumber": 1, "totalPages": 1, "totalCount": len(sheet.summary), "data": sheet.summary}
+            if name == "add_summary_fields":
+                return 200, {"message": "SUCCESS", "resultCode": 0, "result": sheet.add_summary_fields(body)}
+            if name == "update_summary_fields":
+                return 200, {"message": "SUCCESS", "resultCode": 0, "result": sheet.update_summary_fields(body)}
+            if name == "add_rows":
+                rows = body if isinstance(body, list) else [body]
+                return 200, {"message": "SUCCESS", "resultCode": 0, "version": sheet.version, "result": sheet.add_rows(rows)}
+            if name == "update_rows":
+                rows = body if isinstance(body, list) else [body]
+                updated, missing = sheet.update_rows(rows)
+                if missing:
+                    return 404, {"errorCode": 1006, "message": f"Not Found: row {missing[0]}"}
+                return 200, {"message": "SUCCESS", "resultCode": 0, "version": sheet.version, "result": updated}
+            if name == "delete_rows":
+                ids = [int(row_id) for row_id in query.get("ids", "").split(",") if row_id]
+                deleted, missing = sheet.delete_rows(ids, ignore_missing=query.get("ignoreRowsNotFound", "").lower() == "true")
+                if deleted is None:
+                    return 404, {"errorCode": 1006, "message": f"Not Found: row {missing[0]}"}
+                return 200, {"message": "SUCCESS", "resultCode": 0, "version": sheet.version, "result": deleted or []}
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PUT(self):
+            self._handle("PUT")
+
+        def do_DELETE(self):
+            self._handle("DELETE")
+
+    return Handler
+
+
+def start(port=0, **settings):
+    '''runs the fake on a background thread of this process (the tests use it this way), returns (server, api):
+    server.server_address[1] is the port, server.shutdown() stops it, api is the FakeSmartsheet to inspect or change'''
+    api = FakeSmartsheet(**settings)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(api))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, api
+
+
+def serve(port=0, ready=None, **settings):
+    '''runs the fake until the process is killed, ready (a multiprocessing queue) gets the port once it is listening'''
+    api = FakeSmartsheet(**settings)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(api))
+    server.daemon_threads = True
+    if ready is not None:
+        ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=150)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="share of requests answered 429")
+    parser.add_argument("--server-errors", type=float, default=0.0, help="share of requests answered 500/502/503")
+    args = parser.parse_args()
+    print(f"fake smartsheet on http://127.0.0.1:{args.port}/2.0")
+    serve(args.port, rows=args.rows, columns=args.columns, latency=args.latency,
+          rate_limit=args.rate_limit, server_errors=args.server_errors)
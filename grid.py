@@ -1,18 +1,177 @@
 #!/usr/bin/env python
 
 # V7.23.2025
-# TODO: change fetch and fetch summary into dfs that can BOTH exist!
 
-import smartsheet
-import pandas as pd
+import sys
 import datetime
 import time
 import math
+import numbers
 import json
+import threading
+import random
+import importlib
+import logging
+import functools
+import types
+import os
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from requests.exceptions import JSONDecodeError
-from dateutil.parser import parse
-config = json.loads(Path("configs/config.json").read_text())
+from functools import lru_cache
+from contextlib import contextmanager, asynccontextmanager
+
+
+class _LazyModule:
+    '''stands in for a module and imports it the first time one of its attributes is touched instead of right now,
+    pandas/smartsheet/dateutil are most of the cost of importing this file and plenty of short runs never need all of them
+    (importlib.import_module does the actual import, so threads racing on the first touch wait on the import lock
+    and never see a half imported module, which importlib.util.LazyLoader doesn't guarantee before 3.12)'''
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def _lazy_import(name):
+    return sys.modules.get(name) or _LazyModule(name)
+
+
+smartsheet = _lazy_import("smartsheet")
+requests = _lazy_import("requests")
+pd = _lazy_import("pandas")
+dateutil_parser = _lazy_import("dateutil.parser")
+sqlite3 = _lazy_import("sqlite3")
+# only AsyncGrid needs it, and it costs more to import than the rest of this file's standard library together
+asyncio = _lazy_import("asyncio")
+
+
+def guess_datetime_format(value):
+    try:
+        from pandas.tseries.api import guess_datetime_format
+    except ImportError:
+        # pandas < 2.2
+        from pandas.core.tools.datetimes import guess_datetime_format
+    return guess_datetime_format(value)
+
+
+logger = logging.getLogger(__name__)
+
+# the _with_retry call running on this thread, so _count_response knows whose numbers the bytes belong to
+_call_context = threading.local()
+
+
+def _count_response(response, stream=False, **kwargs):
+    '''requests response hook on the shared sdk session: request/response bytes and network time for the current _with_retry call'''
+    stats = getattr(_call_context, "stats", None)
+    if stats is not None:
+        body = response.request.body
+        stats["request_bytes"] += len(body) if body else 0
+        length = response.headers.get("Content-Length")
+        # streamed downloads are left alone, reading them here would pull them into memory
+        stats["response_bytes"] += int(length) if length else (0 if stream else len(response.content))
+        stats["network_seconds"] += response.elapsed.total_seconds()
+    return response
+
+
+def _timed(name, rows=None):
+    '''decorator for whole grid operations: the call is recorded as a stage (see grid._stage),
+    rows(self, *args, **kwargs) gives the row count for rows/sec once it has finished'''
+    def wrap(func):
+        @functools.wraps(func)
+        def timed(self, *args, **kwargs):
+            with self._stage(name) as stage:
+                result = func(self, *args, **kwargs)
+                if rows:
+                    stage["rows"] = rows(self, *args, **kwargs)
+            return result
+        return timed
+    return wrap
+
+
+_configs = {}
+
+
+def _load_config(path):
+    '''reads (once per path) the json config holding ss_automation_token, {} if the file isnt there'''
+    path = Path(path)
+    if path not in _configs:
+        _configs[path] = json.loads(path.read_text()) if path.exists() else {}
+    return _configs[path]
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value):
+    '''dateutil fallback for date strings pd.to_datetime couldnt read with the column's format, None if it isnt a date
+    cached since posting data tends to repeat the same few dates'''
+    try:
+        return dateutil_parser.parse(value, fuzzy=False)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _json_default(value):
+    '''json.dumps fallback for write payloads (see grid._rows_request): dates/timestamps as iso, numpy scalars as python values, anything else as text'''
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class _RateLimiter:
+    '''process wide, thread safe limiter every sdk call goes through (see grid._with_retry)
+    token bucket at rate_per_minute, bursting up to a second's worth of requests, that adapts to what the api tells it:
+    throttled() (429/503/rate limit errors) halves the rate down to min_per_minute and, with a Retry-After, holds every caller
+    until it passes; errored() (5xx and the like) eases it off a little; succeeded() creeps it back up to the full rate'''
+
+    def __init__(self, rate_per_minute, min_per_minute=30):
+        self.max_rate = rate_per_minute / 60.0
+        self.min_rate = min_per_minute / 60.0
+        self.rate = self.max_rate
+        self.capacity = max(1.0, self.max_rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        '''blocks until a request is allowed, returns the seconds it waited'''
+        start = time.monotonic()
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - start
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self, retry_after=None):
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def errored(self):
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * 0.9)
+
+    def succeeded(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 100)
 
 
 class grid:
@@ -25,27 +184,89 @@ class grid:
     Important:
     ----------
     Before using this class, the 'token' class attribute should be set 
-    to the SMARTSHEET_ACCESS_TOKEN.
+    to the SMARTSHEET_ACCESS_TOKEN (or pass token=, or keep it as ss_automation_token in config_path).
+    Nothing is read or connected on import: the config is read when an instance needs a token,
+    the sdk client is made on the first api call, and pandas/smartsheet/dateutil load when first used.
 
     Attributes:
     -----------
     token : str, optional
         The access token for Smartsheet API.
+    api_base : str, optional
+        Class attribute, the api root the shared client talks to: None for smartsheet.com, "https://api.smartsheet.eu/2.0"
+        for the EU region, or a local stand in such as benchmarks/fake_smartsheet.py.
+    config_path : str, optional
+        JSON file with ss_automation_token, used when no token is given (default "configs/config.json").
     grid_id : int
         ID of an existing Smartsheet sheet.
     grid_content : dict, optional
         Content of the sheet fetched from Smartsheet as a dictionary.
+    incremental : bool, optional
+        When True, fetch_content() after the first call only pulls rows changed since the last sync.
+    typed : bool, optional
+        When True, fetch_content() builds df with real dtypes (datetime64, bool, float/Int64, category) instead of display strings.
+    call_stats : dict
+        Per sdk call name: number of calls, retries, errors, seconds spent waiting (rate limiter + backoff), total seconds,
+        request/response bytes and network seconds (as seen by the http session).
+    stage_stats : dict
+        Per local step (to_dict, build_df, coerce_dates, payload, chunk) and per operation (fetch_content, sync_content,
+        post_new_rows, update_rows, delete_all_rows): count, errors, seconds, rows and bytes.
+    metrics_hooks : list
+        Callables given every metric event as a dict ({"type": "call"/"stage", "name", "grid_id", "seconds", ...}).
+        Starts as a copy of grid.metrics_hooks. Events also go to this module's logger (logging.getLogger(__name__)) at DEBUG with the event as record.metric.
+    schema_ttl : int
+        Seconds a cached column schema is trusted without a newer sheet version to check it against (default 300).
+    grid_version : int, optional
+        Sheet version as of the last fetch/sync.
+    grid_modified_at : str, optional
+        Sheet modifiedAt as of the last fetch/sync, used as rowsModifiedSince for the next sync.
+    journal_path : str
+        Class attribute, the sqlite file journaled() uses when it isn't given a path (default "grid_journal.sqlite3").
+    snapshot_dir : str, optional
+        Folder for on-disk snapshots. fetch_content() writes df, row ids, columns and the version there (grid_rows is rebuilt from them),
+        and a later process reuses the snapshot after one get_sheet_version check (or syncs from it when incremental=True).
+        Without pyarrow (or for columns arrow can't hold) the frames fall back to pickles, keep the folder private then.
+    key_normalizer : callable, optional
+        Class attribute, normalize(value, column_type) -> hashable used to compare upsert keys (default _normalize_key).
+    duplicate_keys : dict
+        Keys that matched more than one sheet row in the last grab_posting_row_ids, {key: [row ids]}.
+    summary_df : DataFrame, optional
+        Summary fields as of the last fetch_summary_content(), one row per field.
+    partial_content : bool
+        True when the last fetch_content() only pulled some columns/rows (columns=, row_ids= or filter_id=).
 
     Methods:
     --------
-    get_column_df() -> DataFrame:
-        Returns a DataFrame with details about the columns, such as title, type, options, etc.
+    get_column_df(refresh: bool=False) -> DataFrame:
+        Returns a DataFrame with details about the columns, such as title, type, options, etc. Served from a per-sheet cache
+        (filled by fetch_content too) that is dropped when the sheet version moves or after schema_ttl seconds.
 
-    fetch_content() -> None:
+    fetch_content(incremental: bool=None, typed: bool=None, page_size: int=None, columns: List[Union[int, str]]=None, row_ids: List[int]=None, filter_id: int=None) -> None:
         Fetches the sheet content from Smartsheet and sets various attributes like columns, rows, row IDs, etc.
+        columns/row_ids/filter_id have the api leave out everything else, df then only holds those columns and rows.
+
+    fetch_many(sheet_ids: List[int], max_workers: int=8, summaries: bool=False, token: str=None, config_path: str=None, **fetch_kwargs) -> Tuple[dict, dict, dict]:
+        Classmethod, fetches many sheets (and optionally their summaries) concurrently over one pooled client.
+        Returns ({sheet_id: df}, {sheet_id: summary df}, {sheet_id: {"content"/"summary": exception}}).
+
+    iter_content(page_size: int=5000) -> Iterator[DataFrame]:
+        Pulls the sheet one page at a time and yields one DataFrame per page, for streaming very large sheets with bounded memory.
+
+    sync_content() -> None:
+        Pulls only the rows modified since the last fetch and merges them (including deletions) into df, grid_rows and grid_row_ids.
+
+    fetch_row_ids() -> List[int]:
+        Returns the sheet's current row ids, in order, without downloading the rest of the grid.
 
     fetch_summary_content() -> None:
-        Fetches and constructs a summary DataFrame for summary columns.
+        Fetches and constructs a summary DataFrame for summary columns, kept in summary_df/summary_content (df is left alone).
+
+    deferred_stamps() -> ContextManager:
+        Holds back the "Last API Automation" stamp for everything written inside the block and stamps once at the end.
+
+    journaled(job_id: str, path: str=None) -> ContextManager:
+        Records every bulk write chunk in a local sqlite journal as it commits. Re-running a failed job with the same job_id
+        only sends the chunks that didn't make it. The job is cleared from the journal once its block succeeds.
 
     reduce_columns(exclusion_string: str) -> None:
         Removes columns from the 'column_df' attribute based on characters/symbols provided in the exclusion_string.
@@ -54,111 +275,569 @@ class grid:
         Prepares a dictionary for column IDs based on their titles. Used internally for posting new rows.
 
     delete_all_rows() -> None:
-        Deletes all rows in the current sheet.
+        Deletes all rows in the current sheet (ids only fetch, then chunked deletes through the rate limited worker pool).
 
-    post_new_rows(posting_data: List[Dict[str, Any]], post_fresh: bool=False, post_to_top: bool=False) -> None:
+    post_new_rows(posting_data: Union[List[Dict[str, Any]], DataFrame], post_fresh: bool=False, post_to_top: bool=False) -> None:
         Posts new rows to the Smartsheet. Can optionally delete the whole sheet before posting or set the position of the new rows.
+        Writes build plain json rows (_row_payloads) and send them as raw request bodies, no sdk Row/Cell objects per cell.
+
+    update_rows(posting_data: Union[List[Dict[str, Any]], DataFrame], primary_key: str, update_type: str='default'):
+        Updates rows that can be updated, posts rows that do not map to the sheet. update_type='diff' only sends the cells that changed.
 
-    update_rows(posting_data: List[Dict[str, Any]], primary_key: str):
-        Updates rows that can be updated, posts rows that do not map to the sheet.
+    write_dataframe(df: DataFrame, key: Union[str, List[str]]=None, mode: str='upsert', changed_only: bool=True) -> dict:
+        Syncs a DataFrame to the sheet: aligns it by key with one merge, then sends the changed cells, new rows and (mode='replace')
+        deletions as bulk requests. mode='append' just posts it. Returns (and keeps as write_summary) the counts and requests used.
 
-    grab_posting_row_ids(posting_data: List[Dict[str, Any]], primary_key: str):
+    grab_posting_row_ids(posting_data: List[Dict[str, Any]], primary_key: Union[str, List[str]]):
         returns a new posting_data called update_data that is a dictionary whose key is the row id, and whose value is the dictionary for the row <column name>:<field value>
+        Matches through the session's key index (single or composite keys, normalized), which post_new_rows keeps up to date.
+
+    key_index(primary_key: Union[str, List[str]]) -> Dict[Any, int]:
+        The normalized key -> row id index used for upserts. Keys found on several rows end up in duplicate_keys.
 
     
     Dependencies:
     -------------
     - smartsheet (from smartsheet-python-sdk)
     - pandas as pd
+    - pyarrow (optional, but wanted with snapshot_dir: snapshots are memory mappable arrow/feather files with it, pickles without it)
     """
 
     token = None
+    # where the token is read from when neither token= nor grid.token is given, relative to the working directory
+    config_path = "configs/config.json"
+    # smartsheet allows 300 requests per minute per token, shared by every instance in the process
+    _rate_limiter = _RateLimiter(300)
+    # chunking/concurrency for bulk writes (see _dispatch)
+    # one worker by default: smartsheet applies one write per sheet at a time, concurrent ones just come back as 4004s to retry
+    max_chunk_rows = 350
+    max_chunk_bytes = 1000000
+    max_workers = 1
+    # row ids for delete_rows go in the query string, so these chunks are capped by url length rather than body size
+    delete_chunk_rows = 400
+    # column schema per sheet id, shared by every instance (see _cached_schema)
+    _schema_cache = {}
+    schema_ttl = 300
+    # one pooled sdk client per token, shared by every instance (see _client)
+    # api_base: None for smartsheet.com, "https://api.smartsheet.eu/2.0" for the eu region, or a local stand in (benchmarks/fake_smartsheet.py)
+    api_base = None
+    pool_connections = 16
+    # callables handed every metric event (see _emit), on top of the ones added to an instance's metrics_hooks
+    metrics_hooks = []
+    # key normalizer for upserts, normalize(value, column_type) -> hashable (None = _normalize_key)
+    key_normalizer = None
+    # summary field id per (sheet id, field title), shared by every instance (see grabrcreate_sum_id)
+    _summary_field_ids = {}
+    # folder for on-disk snapshots of fetched sheets (see _save_snapshot), None = no snapshots
+    snapshot_dir = None
+    # sqlite file journaled() keeps its jobs in when it isn't given a path, relative to the working directory
+    journal_path = "grid_journal.sqlite3"
+    _clients = {}
+    _clients_lock = threading.Lock()
 
-    def __init__(self, grid_id):
+    def __init__(self, grid_id, incremental=False, typed=False, token=None, config_path=None, snapshot_dir=None):
         self.grid_id = grid_id
         self.grid_content = None
-        self.token = config['ss_automation_token']
-        if self.token == None:
-            return "MUST SET TOKEN"
-        else:
-            self.smart = smartsheet.Smartsheet(access_token=self.token)
-            self.smart.errors_as_exceptions(True)           
+        self.incremental = incremental
+        self.typed = typed
+        if snapshot_dir is not None:
+            self.snapshot_dir = snapshot_dir
+        # per sdk call: {"calls", "retries", "errors", "wait_seconds", "seconds"} (see _with_retry)
+        self.call_stats = {}
+        # per local step or whole operation: {"count", "errors", "seconds", "rows", "bytes"} (see _stage)
+        self.stage_stats = {}
+        self.metrics_hooks = list(grid.metrics_hooks)
+        # guessed strftime format per date column title (see _coerce_date_column)
+        self._date_formats = {}
+        self._stats_lock = threading.Lock()
+        self.grid_version = None
+        self.grid_modified_at = None
+        # token: passed in > grid.token > ss_automation_token in config_path (read on first use, not on import)
+        if token is not None:
+            self.token = token
+        elif self.token == None:
+            self.token = _load_config(config_path or grid.config_path).get('ss_automation_token')
+        # primary key indexes, see _key_index
+        self._key_indexes = {}
+        self.duplicate_keys = {}
+        # True while df only holds some of the columns/rows (fetch_content(columns=, row_ids=, filter_id=))
+        self.partial_content = False
+        # open deferred_stamps() blocks, and whether a stamp was asked for inside them
+        self._stamp_depth = 0
+        self._stamp_pending = False
+        # the job journal of the journaled() block we're in, if any
+        self._journal = None
+        # sdk client, made (or borrowed from _clients) on the first api call (see smart)
+        self._smart = None
+    @property
+    def smart(self):
+        if self._smart is None:
+            self._smart = grid._client(self.token)
+        return self._smart
+    @smart.setter
+    def smart(self, client):
+        self._smart = client
+    @classmethod
+    def _client(cls, token):
+        '''the process wide sdk client for this token (and api_base), built once so every instance shares one http session/connection pool
+        (pool_connections wide) instead of opening its own'''
+        with cls._clients_lock:
+            client = cls._clients.get((token, cls.api_base))
+            if client is None:
+                # max_retry_time=0 turns off the sdk's own silent retry loop, _with_retry does the retrying through the shared limiter
+                options = {"api_base": cls.api_base} if cls.api_base else {}
+                client = smartsheet.Smartsheet(access_token=token, max_connections=cls.pool_connections, max_retry_time=0, **options)
+                client.errors_as_exceptions(True)
+                session = getattr(client, "_session", None)
+                if session is not None:
+                    # requests takes a single hook or a list, the sdk installs a single one of its own
+                    hooks = session.hooks.get("response") or []
+                    session.hooks["response"] = (hooks if isinstance(hooks, list) else [hooks]) + [_count_response]
+                cls._clients[(token, cls.api_base)] = client
+            return client
 #region core get requests   
-    def get_column_df(self):
-        '''returns a df with data on the columns: title, type, options, etc...'''
+    def get_column_df(self, refresh=False):
+        '''returns a df with data on the columns: title, type, options, etc...
+        served from the per-sheet schema cache (see _cached_schema) unless refresh=True or the cache is stale'''
         if self.token == None:
             return "MUST SET TOKEN"
         else:
-            return pd.DataFrame.from_dict(
-                (self.smart.Sheets.get_columns(
+            schema = None if refresh else self._cached_schema()
+            if schema is None or schema["column_df"] is None:
+                schema = self._cache_schema((self._with_retry(lambda: self.smart.Sheets.get_columns(
                     self.grid_id, 
                     level=2, 
                     include='objectValue', 
-                    include_all=True)
+                    include_all=True), call_name="get_columns")
                 ).to_dict().get("data"))
-    def fetch_content(self):
+            return schema["column_df"]
+    def _cached_schema(self):
+        '''the cached schema for this sheet, or None when there isnt one or it went stale
+        stale = the sheet version we last saw is newer than the one it was cached at, or it is older than schema_ttl seconds'''
+        schema = grid._schema_cache.get(self.grid_id)
+        if schema is None:
+            return None
+        if self.grid_version is not None and schema["version"] is not None and schema["version"] != self.grid_version:
+            return None
+        if time.time() - schema["cached_at"] > self.schema_ttl:
+            return None
+        return schema
+    def _cache_schema(self, columns):
+        '''stores a list of column dicts from get_columns (level 2, objectValue) as this sheet's schema:
+        the columns, their column_df plus a {title: column id} index so title lookups are a dict hit'''
+        schema = {
+            "columns": columns,
+            "column_df": pd.DataFrame.from_dict(columns),
+            "title_ids": {column.get("title"): column.get("id") for column in columns},
+            "version": self.grid_version,
+            "cached_at": time.time(),
+        }
+        grid._schema_cache[self.grid_id] = schema
+        return schema
+    def _cache_title_ids(self, columns):
+        '''the {title: column id} index off a get sheet response's columns
+        those come without level/include, so they can't stand in for get_columns' column_df: a cached one is kept while it is
+        fresh and the titles still match, else the next get_column_df asks get_columns again'''
+        title_ids = {column.get("title"): column.get("id") for column in columns}
+        schema = self._cached_schema()
+        if schema is None or schema["title_ids"] != title_ids:
+            schema = {"columns": None, "column_df": None, "title_ids": title_ids, "version": self.grid_version, "cached_at": time.time()}
+            grid._schema_cache[self.grid_id] = schema
+        return schema
+    @_timed("fetch_content", rows=lambda self, *args, **kwargs: len(self.df) if getattr(self, "df", None) is not None else None)
+    def fetch_content(self, incremental=None, typed=None, page_size=None, columns=None, row_ids=None, filter_id=None):
         '''this fetches data, ask coby why this is seperated
-        when this is done, there are now new objects created for various scenarios-- column_ids, row_ids, and the main sheet df'''
+        when this is done, there are now new objects created for various scenarios-- column_ids, row_ids, and the main sheet df
+        incremental (default: self.incremental) = after the first fetch, only pull rows changed since the last one (see sync_content)
+        typed (default: self.typed) = build df columns with real dtypes from the column types instead of display strings (see _build_df)
+        page_size = pull the sheet in pages of this many rows (see iter_content) and stitch them into df, for very big sheets
+        columns = only pull these columns: ids, titles, or what reduce_columns left (reduced_column_ids, reduced_column_names, column_reduction)
+        row_ids = only pull these rows, filter_id = only keep the rows a saved filter on the sheet shows
+        any of the last three makes it a partial fetch (see _fetch_partial), which skips snapshots and incremental sync'''
         if self.token == None:
             return "MUST SET TOKEN"
-        else:
-            self.grid_content = (self.smart.Sheets.get_sheet(self.grid_id)).to_dict()
-            self.grid_name = (self.grid_content).get("name")
-            self.grid_url = (self.grid_content).get("permalink")
-            # this attributes pulls the column headers
-            self.grid_columns = [i.get("title") for i in (self.grid_content).get("columns")]
-            # note that the grid_rows is equivelant to the cell's 'Display Value'
+        if incremental is None:
+            incremental = self.incremental
+        if typed is None:
+            typed = self.typed
+        query = self._projection_params(columns, row_ids, filter_id)
+        if query:
+            return self._fetch_partial(query, typed, page_size)
+        if incremental and self.grid_version is not None and not self.partial_content:
+            return self.sync_content(typed=typed)
+        if self.snapshot_dir and self.grid_version is None:
+            meta = self._read_snapshot_meta(typed)
+            if meta is not None:
+                if incremental:
+                    # start from the snapshot and let sync pull whatever changed since it was written
+                    self._load_snapshot(meta)
+                    return self.sync_content(typed=typed)
+                version = self._with_retry(lambda: self.smart.Sheets.get_sheet_version(self.grid_id), call_name="get_sheet_version").version
+                if version == meta["version"]:
+                    return self._load_snapshot(meta)
+        if page_size:
+            frames = []
             self.grid_rows = []
-            if (self.grid_content).get("rows") == None:
-                self.grid_rows = []
-            else:
-                for i in (self.grid_content).get("rows"):
-                    b = i.get("cells")
-                    c = []
-                    for i in b:
-                        l = i.get("displayValue")
-                        m = i.get("value")
-                        if l == None:
-                            c.append(m)
-                        else:
-                            c.append(l)
-                    (self.grid_rows).append(c)
-            
-            # resulting fetched content
-            self.grid_rows = self.grid_rows
-            if (self.grid_content).get("rows") == None:
-                self.grid_row_ids = []
-            else:
-                self.grid_row_ids = [i.get("id") for i in (self.grid_content).get("rows")]
-            self.grid_column_ids = [i.get("id") for i in (self.grid_content).get("columns")]
-            self.df = pd.DataFrame(self.grid_rows, columns=self.grid_columns)
-            # Should be row_id intead of id as that is less likely to be taken name space!!!
-            self.df["id"]=self.grid_row_ids
+            for df, grid_rows in self._iter_pages(page_size, typed):
+                frames.append(df)
+                self.grid_rows.extend(grid_rows)
+            self.df = self._concat_frames(frames)
+            if typed and len(frames) > 1:
+                self._retype_columns(self.df, self.grid_rows, self.grid_content.get("columns"))
+            del frames
+            self.grid_row_ids = self.df["id"].tolist()
             self.column_df = self.get_column_df()
+        else:
+            self._fetch_sheet(typed)
+        self.partial_content = False
+        self._save_snapshot(typed)
+    def _fetch_sheet(self, typed):
+        '''the whole sheet in one get sheet request, its raw json kept (rows and all) as grid_content'''
+        self.grid_content = self._get_sheet_json()
+        # an empty sheet comes back without rows, it still has its raw rows (none)
+        self.grid_content.setdefault("rows", [])
+        self._set_sheet_meta(self.grid_content)
+        # note that the grid_rows is equivelant to the cell's 'Display Value'
+        # Should be row_id intead of id as that is less likely to be taken name space!!!
+        self.df, self.grid_rows = self._build_df(
+            (self.grid_content).get("rows") or [],
+            (self.grid_content).get("columns"),
+            typed=typed)
+        self.grid_row_ids = self.df["id"].tolist()
+        self._cache_title_ids((self.grid_content).get("columns"))
+        self.column_df = self.get_column_df()
+    def _fetch_raw_rows(self):
+        '''a full fetch for the writes that compare against every row's raw cells in grid_content (update_rows diff, write_dataframe)
+        a snapshot doesn't keep the raw rows, so when fetch_content put one back this gets the sheet from the api after all'''
+        self.fetch_content(incremental=False, page_size=None)
+        if "rows" not in self.grid_content:
+            self._fetch_sheet(self.typed)
+            self._save_snapshot(self.typed)
+    def _projection_params(self, columns, row_ids, filter_id):
+        '''get sheet query params for fetch_content's columns/row_ids/filter_id, {} when none of them are given'''
+        query = {}
+        if columns is not None:
+            query["columnIds"] = self._resolve_column_ids(columns)
+        if row_ids is not None:
+            query["rowIds"] = [int(row_id) for row_id in row_ids]
+            if not query["rowIds"]:
+                raise ValueError("row_ids is empty, leave it as None to fetch every row")
+        if filter_id is not None:
+            query["filterId"] = filter_id
+        return query
+    def _resolve_column_ids(self, columns):
+        '''column ids for columns= (a single id/title, a list mixing ids and titles, or reduce_columns' column_reduction df)
+        titles are looked up in the schema cache, raises IndexError for titles that arent on the sheet'''
+        if isinstance(columns, (str, numbers.Integral)):
+            columns = [columns]
+        elif isinstance(columns, pd.DataFrame):
+            columns = columns["id"].tolist()
+        if any(isinstance(column, str) for column in columns):
+            title_ids = self._column_title_ids_for([column for column in columns if isinstance(column, str)])
+            columns = [title_ids[column] if isinstance(column, str) else column for column in columns]
+        # dict.fromkeys drops repeats and keeps the order
+        column_ids = list(dict.fromkeys(int(column) for column in columns))
+        if not column_ids:
+            raise ValueError("columns is empty, leave it as None to fetch every column")
+        return column_ids
+    def _fetch_partial(self, query, typed, page_size):
+        '''fetch_content for a column projection and/or row filter, the api only sends what was asked for
+        df/grid_rows/grid_row_ids/column_df (and grid_columns/grid_column_ids) only hold the requested columns and rows, grid_content is the sheet
+        info without rows. the partial columns are kept out of the schema cache and nothing is snapshotted, partial_content=True makes the next
+        incremental fetch/sync a full one and has upserts refetch the whole sheet before building a key index'''
+        if page_size and "rowIds" not in query:
+            pieces = self._iter_pages(page_size, typed, **query)
+        else:
+            # row ids go in the query string, sent in chunks like deletes so the url stays short
+            pieces = self._iter_row_id_chunks(typed, **query)
+        frames = []
+        self.grid_rows = []
+        for df, grid_rows in pieces:
+            frames.append(df)
+            self.grid_rows.extend(grid_rows)
+        self.df = self._concat_frames(frames)
+        if typed and len(frames) > 1:
+            self._retype_columns(self.df, self.grid_rows, self.grid_content.get("columns"))
+        del frames
+        self.grid_row_ids = self.df["id"].tolist()
+        self.column_df = pd.DataFrame.from_dict(self.grid_content.get("columns"))
+        self.partial_content = True
+    def _iter_row_id_chunks(self, typed, rowIds=None, **query):
+        '''yields (df, grid_rows) per delete_chunk_rows row ids (one request when there are no row ids), sets the sheet meta off the first'''
+        chunks = [rowIds[i:i + self.delete_chunk_rows] for i in range(0, len(rowIds), self.delete_chunk_rows)] if rowIds else [None]
+        for i, chunk in enumerate(chunks):
+            content = self._get_sheet_json(**query, **({"rowIds": chunk} if chunk else {}))
+            if i == 0:
+                self._set_sheet_meta(content)
+                self.grid_content = {key: value for key, value in content.items() if key != "rows"}
+            rows = self._shown_rows(content.pop("rows", None) or [], query)
+            yield self._build_df(rows, content.get("columns"), typed=typed)
+    @classmethod
+    def fetch_many(cls, sheet_ids, max_workers=8, summaries=False, token=None, config_path=None, **fetch_kwargs):
+        '''fetches several sheets at once on a thread pool, all sharing the pooled client and the rate limiter
+        fetch_kwargs go to each fetch_content (typed, page_size, etc...), summaries=True also pulls each sheet's summary fields as its own task
+        returns (dfs, summary_dfs, errors): {sheet_id: df}, {sheet_id: summary df} and {sheet_id: {"content"/"summary": exception}},
+        a sheet that fails just shows up in errors instead of stopping the rest'''
+        def content(sheet_id):
+            sheet = cls(sheet_id, token=token, config_path=config_path)
+            sheet.fetch_content(**fetch_kwargs)
+            return sheet.df
+        def summary(sheet_id):
+            sheet = cls(sheet_id, token=token, config_path=config_path)
+            sheet.fetch_summary_content()
+            return sheet.summary_df
+
+        tasks = [(sheet_id, "content", content) for sheet_id in sheet_ids]
+        if summaries:
+            tasks += [(sheet_id, "summary", summary) for sheet_id in sheet_ids]
+        dfs, summary_dfs, errors = {}, {}, {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks) or 1))) as pool:
+            futures = {pool.submit(func, sheet_id): (sheet_id, kind) for sheet_id, kind, func in tasks}
+            for future in as_completed(futures):
+                sheet_id, kind = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    errors.setdefault(sheet_id, {})[kind] = e
+                    continue
+                (dfs if kind == "content" else summary_dfs)[sheet_id] = df
+        # hand them back in the order they were asked for, not the order they finished
+        in_order = lambda found: {sheet_id: found[sheet_id] for sheet_id in sheet_ids if sheet_id in found}
+        return in_order(dfs), in_order(summary_dfs), errors
+    def iter_content(self, page_size=5000, typed=None):
+        '''generator version of fetch_content for sheets too big to hold comfortably: pulls the sheet page by page (page/pageSize)
+        and yields one df per page, so a sheet can be streamed into a sink with about one page in memory at a time
+        sets the sheet attributes (grid_name, grid_columns, grid_version, etc...) but not df/grid_rows, use fetch_content(page_size=...) for those
+        raises ValueError if the sheet changes between pages (rows would shift between pages)'''
+        if typed is None:
+            typed = self.typed
+        for df, grid_rows in self._iter_pages(page_size, typed):
+            del grid_rows
+            yield df
+    def _iter_pages(self, page_size, typed, **query):
+        '''yields (df, grid_rows) per page, each page's json is dropped before the next request goes out
+        query = extra get sheet params (columnIds/filterId from _fetch_partial), the column titles are only cached when there are none'''
+        page = 1
+        while True:
+            content = self._get_sheet_json(pageSize=page_size, page=page, **query)
+            if page == 1:
+                self._set_sheet_meta(content)
+                if not query:
+                    self._cache_title_ids(content.get("columns"))
+                # keep the sheet level info around like fetch_content does, just not the rows
+                self.grid_content = {key: value for key, value in content.items() if key != "rows"}
+            elif content.get("version") != self.grid_version:
+                raise ValueError(f"Sheet {self.grid_id} changed while it was being paged (version {self.grid_version} -> {content.get('version')}), start over")
+            total = content.get("totalRowCount") or 0
+            page_rows = self._shown_rows(content.pop("rows", None) or [], query)
+            columns = content.get("columns")
+            del content
+            df, grid_rows = self._build_df(page_rows, columns, typed=typed)
+            del page_rows
+            yield df, grid_rows
+            if page * page_size >= total:
+                break
+            page += 1
+    @staticmethod
+    def _shown_rows(rows, query):
+        '''the rows of a get sheet response its query asked for: with a filterId the api still sends the rows the filter hides,
+        just marked filteredOut'''
+        if "filterId" not in query:
+            return rows
+        return [row for row in rows if not row.get("filteredOut")]
+    def _set_sheet_meta(self, content):
+        '''sheet level attributes from a get sheet response (everything but the rows)'''
+        self.grid_name = content.get("name")
+        self.grid_url = content.get("permalink")
+        self.grid_version = content.get("version")
+        self.grid_modified_at = content.get("modifiedAt")
+        # this attributes pulls the column headers
+        self.grid_columns = [i.get("title") for i in content.get("columns")]
+        self.grid_column_ids = [i.get("id") for i in content.get("columns")]
+    @_timed("sync_content")
+    def sync_content(self, typed=None):
+        '''incremental version of fetch_content, merges the changes since the last fetch/sync into df, grid_rows and grid_row_ids in place
+        1. asks for the sheet version, if it hasnt moved there is nothing to do (one tiny request)
+        2. pulls only the rows modified since grid_modified_at
+        3. pulls the current row ids (one column, no blank cells) to catch deleted/moved rows
+        falls back to a full fetch_content when there is nothing to merge into (or only a partial fetch) or the columns changed'''
+        if self.token == None:
+            return "MUST SET TOKEN"
+        if typed is None:
+            typed = self.typed
+        if self.grid_version is None or getattr(self, "df", None) is None or self.partial_content:
+            return self.fetch_content(incremental=False, typed=typed)
+
+        version = self._with_retry(lambda: self.smart.Sheets.get_sheet_version(self.grid_id), call_name="get_sheet_version").version
+        if version == self.grid_version:
+            return
+
+        # the sdk's to_dict writes timestamps as "...+00:00Z", which the api won't take back
+        changed = self._get_sheet_json(rowsModifiedSince=str(self.grid_modified_at).replace("+00:00Z", "Z"))
+        if [i.get("id") for i in changed.get("columns")] != self.grid_column_ids:
+            # columns were added/removed/moved, the cached rows no longer line up
+            return self.fetch_content(incremental=False, typed=typed)
+
+        changed_rows = changed.get("rows") or []
+        current_ids = self.fetch_row_ids()
+        position = {row_id: i for i, row_id in enumerate(self.grid_row_ids)}
+        changed_ids = set(row.get("id") for row in changed_rows)
+
+        # rows added between the two requests above are in neither, grab them by id
+        missing = [row_id for row_id in current_ids if row_id not in position and row_id not in changed_ids]
+        if missing:
+            changed_rows = changed_rows + (self._get_sheet_json(rowIds=missing).get("rows") or [])
+            changed_ids = set(row.get("id") for row in changed_rows)
+            current_ids = [row_id for row_id in current_ids if row_id in position or row_id in changed_ids]
+        current_set = set(current_ids)
+        changed_rows = [row for row in changed_rows if row.get("id") in position or row.get("id") in current_set]
+        changed_df, changed_grid_rows = self._build_df(changed_rows, changed.get("columns"), typed=typed)
+        updated = dict(zip(changed_df["id"].tolist(), changed_grid_rows))
+
+        # lists first (in place so outside references stay valid)
+        self.grid_rows[:] = [updated[row_id] if row_id in updated else self.grid_rows[position[row_id]] for row_id in current_ids]
+        self.grid_row_ids[:] = current_ids
+
+        # then the df: keep the untouched rows, stack the changed ones under them, and put everything back in sheet order
+        # (deleted rows simply aren't in current_ids anymore)
+        kept_df = self.df[self.df["id"].isin(current_ids) & ~self.df["id"].isin(list(updated))]
+        self.df = (self._concat_frames([kept_df, changed_df])
+                   .set_index("id", drop=False)
+                   .loc[current_ids]
+                   .reset_index(drop=True))
+        if typed:
+            # kept rows and changed rows were typed separately
+            self._retype_columns(self.df, self.grid_rows, changed.get("columns"))
+
+        self.grid_content = changed
+        self._set_sheet_meta(changed)
+        self._cache_title_ids(changed.get("columns"))
+        self.column_df = self.get_column_df()
+        self._save_snapshot(typed)
+    def fetch_row_ids(self):
+        '''returns the current row ids of the sheet, in sheet order, without pulling the grid
+        (asks for a single column and skips cells that never had data, so the payload is basically just ids)'''
+        if getattr(self, "grid_column_ids", None):
+            column_id = self.grid_column_ids[0]
+        else:
+            column_id = self._with_retry(lambda: self.smart.Sheets.get_columns(self.grid_id, page_size=1), call_name="get_columns").data[0].id
+        sheet = self._get_sheet_json(columnIds=[column_id], exclude="nonexistentCells")
+        return [row.get("id") for row in (sheet.get("rows") or [])]
+    def _get_sheet_json(self, **query_params):
+        '''GET /sheets/{id} through the sdk passthrough so the response stays plain json
+        (get_sheet builds a model object per cell and then .to_dict() walks them all again)
+        query_params use the api's names: rowsModifiedSince, rowIds, columnIds, pageSize, page, exclude, etc...'''
+        response = self._with_retry(lambda: self.smart.Passthrough.get(
+            f"/sheets/{self.grid_id}",
+            query_params or None), call_name="get_sheet")
+        with self._stage("to_dict"):
+            return response.to_dict()
     def fetch_summary_content(self):
-        '''builds the summary df for summary columns'''
+        '''builds the summary df for summary columns, kept apart from the sheet itself: self.summary_content (raw json) and self.summary_df,
+        so df/grid_content/grid_rows/grid_row_ids are left alone
+        also refreshes the summary field id cache (see grabrcreate_sum_id)'''
         if self.token == None:
             return "MUST SET TOKEN"
         else:
-            self.grid_content = (self.smart.Sheets.get_sheet_summary_fields(self.grid_id)).to_dict()
+            self.summary_content = (self._with_retry(lambda: self.smart.Sheets.get_sheet_summary_fields(self.grid_id), call_name="get_sheet_summary_fields")).to_dict()
             # this attributes pulls the column headers
             self.summary_params=['title','createdAt', 'createdBy', 'displayValue', 'formula', 'id', 'index', 'locked', 'lockedForUser', 'modifiedAt', 'modifiedBy', 'objectValue', 'type']
-            self.grid_rows = []
-            if (self.grid_content).get("data") == None:
-                self.grid_rows = []
-            else:
-                for summary_field in (self.grid_content).get("data"):
-                    row = []
-                    for param in self.summary_params:
-                        row_value = summary_field.get(param)
-                        row.append(row_value)
-                    self.grid_rows.append(row)
-            if (self.grid_content).get("rows") == None:
-                self.grid_row_ids = []
-            else:
-                self.grid_row_ids = [i.get("id") for i in (self.grid_content).get("data")]
-            self.df = pd.DataFrame(self.grid_rows, columns=self.summary_params)
+            summary_rows = []
+            for summary_field in (self.summary_content).get("data") or []:
+                summary_rows.append([summary_field.get(param) for param in self.summary_params])
+                grid._summary_field_ids[(self.grid_id, summary_field.get("title"))] = summary_field.get("id")
+            self.summary_df = pd.DataFrame(summary_rows, columns=self.summary_params)
 #endregion 
+#region snapshots
+    def _snapshot_path(self):
+        return Path(self.snapshot_dir) / str(self.grid_id)
+    def _read_snapshot_meta(self, typed):
+        '''the snapshot's meta.json (version, modifiedAt, columns, get_columns' columns, row ids, file names), None if there is no usable snapshot'''
+        try:
+            meta = json.loads((self._snapshot_path() / "meta.json").read_text())
+        except (OSError, ValueError):
+            return None
+        # a typed snapshot can't stand in for an untyped fetch or the other way around
+        if meta.get("typed") != bool(typed):
+            return None
+        # written before the display values had their own file, its grid_rows can't be rebuilt
+        if typed and "display_file" not in meta:
+            return None
+        return meta
+    def _load_snapshot(self, meta):
+        '''puts a snapshot back as if fetch_content had just run: df, grid_rows, grid_row_ids, sheet attributes and column_df
+        grid_rows is rebuilt from the display values (df itself unless typed), grid_content comes back without its raw rows (see _fetch_raw_rows)'''
+        path = self._snapshot_path()
+        self.df = self._read_frame(path, meta["df_file"], meta["df_format"])
+        if meta.get("display_file"):
+            display = self._read_frame(path, meta["display_file"], meta["display_format"])
+        else:
+            display = self.df.drop(columns="id")
+        self.grid_rows = display.astype(object).where(display.notna(), None).values.tolist()
+        self.grid_row_ids = meta["row_ids"]
+        self.grid_content = meta["content"]
+        self._set_sheet_meta(self.grid_content)
+        if meta.get("columns") is not None:
+            # get_columns' columns as of the snapshot, the sheet hasn't moved since
+            self._cache_schema(meta["columns"])
+        else:
+            self._cache_title_ids(self.grid_content.get("columns"))
+        self.column_df = self.get_column_df()
+    def _save_snapshot(self, typed):
+        '''writes df and meta.json (plus, for a typed df, the display values grid_rows is rebuilt from) as arrow files, see _write_frame
+        data files are named by sheet version and meta.json is swapped in last, so a reader never sees a half written snapshot'''
+        if not self.snapshot_dir:
+            return
+        path = self._snapshot_path()
+        path.mkdir(parents=True, exist_ok=True)
+        version = self.grid_version
+        df_file, df_format = self._write_frame(self.df, path, f"df-{version}")
+        display_file = display_format = None
+        if typed:
+            titles = [title for title in self.df.columns if title != "id"]
+            display = pd.DataFrame(dict(zip(titles, (list(values) for values in zip(*self.grid_rows)))) if self.grid_rows else {}, columns=titles)
+            display_file, display_format = self._write_frame(display, path, f"display-{version}")
+
+        content = {key: value for key, value in (self.grid_content or {}).items() if key != "rows"}
+        schema = self._cached_schema()
+        meta = {"version": version, "typed": bool(typed), "df_format": df_format, "df_file": df_file,
+                "display_format": display_format, "display_file": display_file, "row_ids": self.grid_row_ids, "content": content,
+                "columns": schema["columns"] if schema is not None else None}
+        tmp = path / f"meta.json.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(meta, default=str))
+        os.replace(tmp, path / "meta.json")
+        # older versions' files are no longer referenced
+        for old_file in path.iterdir():
+            if old_file.name not in (df_file, display_file, "meta.json") and not old_file.name.endswith(".tmp"):
+                old_file.unlink(missing_ok=True)
+    def _write_frame(self, frame, path, stem):
+        '''writes one snapshot frame, returns (file name, format)
+        an uncompressed arrow ipc/feather file, so the reload maps it instead of parsing or decompressing it. when pyarrow isn't
+        installed or a column doesn't fit an arrow type (an object column mixing strings/numbers/bools) it falls back to a pandas
+        pickle, and loading a pickle runs whatever is in it: only point snapshot_dir at a folder nobody else can write to'''
+        try:
+            import pyarrow
+            import pyarrow.feather
+        except ImportError:
+            pyarrow = None
+        if pyarrow is not None:
+            try:
+                pyarrow.feather.write_feather(frame, path / f"{stem}.feather", compression="uncompressed")
+                return f"{stem}.feather", "feather"
+            except (pyarrow.ArrowException, ValueError, TypeError):
+                (path / f"{stem}.feather").unlink(missing_ok=True)
+        logger.info("Snapshot %s of sheet %s written as a pickle (%s)", stem, self.grid_id,
+                    "a column mixes types" if pyarrow is not None else "pyarrow is not installed", extra={"grid_id": self.grid_id})
+        frame.to_pickle(path / f"{stem}.pkl")
+        return f"{stem}.pkl", "pickle"
+    def _read_frame(self, path, file_name, file_format):
+        '''reads one snapshot frame back: arrow files through a memory map (to_pandas still copies into pandas' own columns
+        what pandas can't share with arrow, the saving is not unpickling or parsing anything), pickles with pd.read_pickle'''
+        if file_format == "feather":
+            import pyarrow.feather
+            return pyarrow.feather.read_table(path / file_name, memory_map=True).to_pandas()
+        return pd.read_pickle(path / file_name)
+#endregion
 #region helpers     
     def reduce_columns(self,exclusion_string):
         """a method on a grid{sheet_id}) object
@@ -170,12 +849,84 @@ class grid:
             self.column_reduction =  self.column_df[self.column_df['title'].str.contains(regex_string,regex=True)==False]
             self.reduced_column_ids = list(self.column_reduction.id)
             self.reduced_column_names = list(self.column_reduction.title)
+    @_timed("build_df", rows=lambda self, rows, *args, **kwargs: len(rows))
+    def _build_df(self, rows, columns, typed=False):
+        '''turns get sheet json rows into (df, grid_rows): one comprehension pulls every row's values, zip(*) turns them into
+        one list per column and the df is built from those columns
+        this is about as fast as the old cell by cell loop (typed=True is slower, it converts every column), see
+        benchmarks/bench_fetch_content.py: what makes fetch_content faster is reading plain json through the passthrough instead of sdk models
+        typed=False keeps the old values (display value, falling back to the raw value), typed=True converts columns by type (see _typed_column)'''
+        titles = [column.get("title") for column in columns]
+        if sum(len(row.get("cells")) for row in rows) != len(rows) * len(columns):
+            # some rows are missing cells (exclude=nonexistentCells, etc...), line them up by column id instead
+            column_ids = [column.get("id") for column in columns]
+            aligned = []
+            for row in rows:
+                by_id = {cell.get("columnId"): cell for cell in row.get("cells")}
+                aligned.append(dict(row, cells=[by_id.get(column_id, {}) for column_id in column_ids]))
+            rows = aligned
+
+        grid_rows = [[cell["displayValue"] if "displayValue" in cell else cell.get("value") for cell in row["cells"]] for row in rows]
+        display_columns = [list(values) for values in zip(*grid_rows)] or [[] for title in titles]
+        if typed:
+            # raw values in one flat row-major pass, each column is then a slice of it
+            raw = [cell.get("value") for row in rows for cell in row["cells"]]
+            n_columns = len(columns)
+            data = {column.get("title"): self._typed_column(column.get("type"), raw[j::n_columns], display)
+                    for j, (column, display) in enumerate(zip(columns, display_columns))}
+        else:
+            data = dict(zip(titles, display_columns))
+        df = pd.DataFrame(data, columns=titles)
+        df["id"] = [row.get("id") for row in rows]
+        return df, grid_rows
+    def _concat_frames(self, frames):
+        '''pd.concat for dfs built by _build_df, keeps category columns as category
+        (concat falls back to object when the pieces have different categories)
+        empty pieces (a page whose rows a filter all hid) are left out, their untyped columns would turn ids into floats'''
+        frames = [frame for frame in frames if len(frame)] or frames[:1]
+        df = pd.concat(frames, ignore_index=True)
+        for title in df.columns:
+            if any(isinstance(frame[title].dtype, pd.CategoricalDtype) for frame in frames) and not isinstance(df[title].dtype, pd.CategoricalDtype):
+                df[title] = df[title].astype("category")
+        return df
+    def _typed_column(self, column_type, values, display):
+        '''one column's values with a real dtype, picked from the column type (values are the raw cell values):
+        DATE/DATETIME/ABSTRACT_DATETIME -> datetime64, CHECKBOX -> bool, PICKLIST -> category,
+        all-numeric raw values -> Int64 (if they are all whole numbers) or float, anything else -> the display values'''
+        if column_type == "CHECKBOX":
+            return pd.Series([bool(value) for value in values], dtype=bool)
+        if column_type in ("DATE", "DATETIME", "ABSTRACT_DATETIME"):
+            return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce", utc=(column_type == "DATETIME"))
+        if column_type == "PICKLIST":
+            return pd.Categorical(display)
+        if pd.api.types.infer_dtype(values, skipna=True) in ("integer", "floating", "mixed-integer-float"):
+            return self._numeric_column(values)
+        return display
+    def _numeric_column(self, values):
+        '''numbers and blanks -> Int64 if they are all whole numbers, float otherwise'''
+        numeric = pd.Series(pd.Series(values, dtype=object).to_numpy(dtype=float, na_value=float("nan")))
+        if (numeric.dropna() % 1 == 0).all():
+            return numeric.astype("Int64")
+        return numeric
+    def _retype_columns(self, df, grid_rows, columns):
+        '''for a typed df stitched together from pieces _build_df typed one at a time (pages, sync batches): the columns whose dtype
+        _typed_column infers from the values (not checkbox/date/picklist) can be numeric in one piece and display values in another,
+        so those are picked again over every row, the way one _build_df over the whole sheet would (grid_rows lines up with df)'''
+        for j, column in enumerate(columns):
+            if column.get("type") in ("CHECKBOX", "DATE", "DATETIME", "ABSTRACT_DATETIME", "PICKLIST"):
+                continue
+            title = column.get("title")
+            if pd.api.types.infer_dtype(df[title], skipna=True) in ("integer", "floating", "mixed-integer-float"):
+                df[title] = self._numeric_column(df[title]).array
+            else:
+                df[title] = [row[j] for row in grid_rows]
+        return df
     def is_date_like(self, s):
         """Returns True if string s appears to be a valid date/time."""
         if not isinstance(s, str):
             return False
         try:
-            parse(s, fuzzy=False)
+            dateutil_parser.parse(s, fuzzy=False)
             return True
         except (ValueError, TypeError):
             return False
@@ -187,44 +938,419 @@ class grid:
         if not isinstance(s, str):
             return s
         try:
-            dt = parse(s, fuzzy=False)
+            dt = dateutil_parser.parse(s, fuzzy=False)
             return dt.isoformat()
         except (ValueError, TypeError):
             return s
     
-    def _with_retry(self, func, *args, max_retries=3, retry_delay=2, **kwargs):
-        '''cateloging issues I get and if they are issues that warrent retry, editing this script to allow for it'''
-        for attempt in range(max_retries):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                should_retry = False    
-
-                # Check if the exception has a status code (e.g. Smartsheet ApiError or HTTPError)
-                if hasattr(e, 'result') and hasattr(e.result, 'statusCode'):
-                    status = getattr(e.result, 'statusCode')
-                    if status in (500, 502):
+    @_timed("coerce_dates", rows=lambda self, posting_data, *args, **kwargs: len(posting_data))
+    def _coerce_dates(self, posting_data, skip=()):
+        '''returns a copy of posting_data with the values of DATE/DATETIME/ABSTRACT_DATETIME columns turned into iso strings
+        the date columns come from the column types (column_df), so text columns are never touched ("May", "3-4" stay text)
+        and each date column is converted in one go (see _coerce_date_column) instead of dateutil parsing every cell twice'''
+        if not posting_data:
+            return posting_data
+        column_df = self.get_column_df()
+        column_types = dict(zip(column_df['title'], column_df['type']))
+        titles = set()
+        for row in posting_data:
+            titles.update(row.keys())
+        date_columns = [title for title in titles
+                        if column_types.get(title) in ("DATE", "DATETIME", "ABSTRACT_DATETIME") and title not in skip]
+        if not date_columns:
+            return posting_data
+        coerced = [dict(row) for row in posting_data]
+        for title in date_columns:
+            values = self._coerce_date_column(title, [row.get(title) for row in posting_data], column_types[title])
+            for row, value in zip(coerced, values):
+                if title in row:
+                    row[title] = value
+        return coerced
+    def _coerce_date_column(self, title, values, column_type):
+        '''one date column's values -> iso strings ("%Y-%m-%d" for DATE, full isoformat otherwise)
+        strings go through one pd.to_datetime call with the column's format (guessed once and kept in self._date_formats),
+        whatever that format misses falls back to a cached dateutil parse, anything unparseable (or not a date) is returned as is'''
+        def to_iso(value):
+            return value.strftime("%Y-%m-%d") if column_type == "DATE" else value.isoformat()
+
+        series = pd.Series(values, dtype=object)
+        out = series.copy()
+        is_text = series.map(lambda value: isinstance(value, str) and value.strip() != "" and not value.startswith("="))
+        text = series[is_text].str.strip()
+        if len(text):
+            date_format = self._date_formats.get(title)
+            if date_format is None:
+                for sample in text.unique()[:10]:
+                    date_format = guess_datetime_format(sample)
+                    if date_format:
+                        self._date_formats[title] = date_format
+                        break
+            parsed = pd.Series(pd.NaT, index=text.index)
+            if date_format:
+                try:
+                    parsed = pd.to_datetime(text, format=date_format, errors="coerce")
+                except (ValueError, TypeError):
+                    # e.g. mixed utc offsets, leave it all to the fallback
+                    pass
+            ok = parsed.notna()
+            if ok.any():
+                if column_type == "DATE" and hasattr(parsed, "dt"):
+                    out[ok[ok].index] = parsed[ok].dt.strftime("%Y-%m-%d")
+                else:
+                    out[ok[ok].index] = parsed[ok].map(to_iso)
+            for index in ok[~ok].index:
+                value = _parse_date(text[index])
+                if value is not None:
+                    out[index] = to_iso(value)
+        for index, value in series[series.map(lambda value: isinstance(value, datetime.date))].items():
+            out[index] = to_iso(value)
+        return out.tolist()
+    def _with_retry(self, func, *args, max_retries=5, retry_delay=2, call_name=None, **kwargs):
+        '''every sdk call goes through here:
+        waits on the process wide rate limiter, then calls func(*args, **kwargs) and retries what is worth retrying
+        - 429/503 and smartsheet's rate limit error (4003): waits the Retry-After the api sent (or backs off) and throttles the shared limiter
+        - 500/502/504, smartsheet's "try again" errors (4001/4002/4004, e.g. another write still running on the sheet) and bad json: jittered exponential backoff
+        call_name is the key the call's numbers are kept under in self.call_stats'''
+        name = call_name or getattr(func, "__name__", "call")
+        stats = {"calls": 1, "retries": 0, "errors": 0, "wait_seconds": 0.0, "seconds": 0.0,
+                 "request_bytes": 0, "response_bytes": 0, "network_seconds": 0.0}
+        start = time.monotonic()
+        outer_stats, _call_context.stats = getattr(_call_context, "stats", None), stats
+        try:
+            for attempt in range(max_retries):
+                stats["wait_seconds"] += grid._rate_limiter.acquire()
+                try:
+                    result = func(*args, **kwargs)
+                    grid._rate_limiter.succeeded()
+                    return result
+                except Exception as e:
+                    stats["errors"] += 1
+                    status, error_code, retry_after = self._error_details(e)
+                    rate_limited = status in (429, 503) or error_code == 4003
+                    should_retry = rate_limited or status in (500, 502, 504) or error_code in (4001, 4002, 4004)
+
+                    if isinstance(e, json.JSONDecodeError):
                         should_retry = True 
 
-                elif hasattr(e, 'response') and hasattr(e.response, 'status_code'):
-                    if e.response.status_code in (500, 502):
+                    elif '502 Bad Gateway' in str(e) or '500 Internal Server Error' in str(e):
                         should_retry = True 
 
-                elif isinstance(e, json.JSONDecodeError):
-                    should_retry = True 
+                    elif 'Expecting value' in str(e):
+                        should_retry = True 
 
-                elif '502 Bad Gateway' in str(e) or '500 Internal Server Error' in str(e):
-                    should_retry = True 
+                    if not should_retry or attempt >= max_retries - 1:
+                        raise
+                    stats["retries"] += 1
+                    if rate_limited and retry_after:
+                        # the limiter holds every caller, not just this one, until Retry-After has passed (acquire() counts the wait)
+                        grid._rate_limiter.throttled(retry_after + random.uniform(0, 1))
+                        logger.warning("[Retry] %s attempt %s/%s was rate limited: %s. Retrying after %.1fs...", name, attempt + 1, max_retries, e, retry_after,
+                                       extra={"grid_id": self.grid_id, "call": name, "attempt": attempt + 1, "retry_after": retry_after})
+                        continue
+                    if rate_limited:
+                        grid._rate_limiter.throttled()
+                    else:
+                        grid._rate_limiter.errored()
+                    # full jitter so a pool of workers doesn't come back in lockstep
+                    wait = random.uniform(0, retry_delay * (2 ** attempt))
+                    stats["wait_seconds"] += wait
+                    logger.warning("[Retry] %s attempt %s/%s failed with error: %s. Retrying in %.1fs...", name, attempt + 1, max_retries, e, wait,
+                                   extra={"grid_id": self.grid_id, "call": name, "attempt": attempt + 1, "wait": wait})
+                    time.sleep(wait)
+        finally:
+            _call_context.stats = outer_stats
+            stats["seconds"] = time.monotonic() - start
+            self._record_call(name, stats)
+    def _error_details(self, e):
+        '''(http status, smartsheet errorCode, Retry-After seconds) from whatever the sdk/requests raised, None where unknown'''
+        status = error_code = response = None
+        error = getattr(e, "error", None)
+        result = getattr(error, "result", None)
+        if result is not None:
+            # smartsheet.exceptions.ApiError
+            status = getattr(result, "status_code", None)
+            error_code = getattr(result, "code", None)
+            response = getattr(error, "request_response", None)
+        elif hasattr(e, 'result') and hasattr(e.result, 'statusCode'):
+            status = getattr(e.result, 'statusCode')
+        elif getattr(e, "response", None) is not None:
+            response = e.response
+        if response is not None and status is None:
+            status = getattr(response, "status_code", None)
+        if isinstance(getattr(e, "status_code", None), int) and status is None:
+            status = e.status_code
+        retry_after = None
+        headers = getattr(response, "headers", None) or {}
+        if headers.get("Retry-After"):
+            try:
+                retry_after = float(headers.get("Retry-After"))
+            except ValueError:
+                pass
+        return status, error_code, retry_after
+    def _record_call(self, name, stats):
+        '''adds one call's numbers into self.call_stats[name] and hands them to the metrics hooks'''
+        with self._stats_lock:
+            totals = self.call_stats.setdefault(name, dict.fromkeys(stats, 0))
+            for key, value in stats.items():
+                totals[key] += value
+        self._emit(dict(stats, type="call", name=name))
+    @contextmanager
+    def _stage(self, name, rows=None):
+        '''times a local step (to_dict, build_df, payload, chunk, coerce_dates) or a whole operation into self.stage_stats[name]
+        the block can fill in stage["rows"] / stage["bytes"] once it knows them'''
+        stage = {"rows": rows, "bytes": None}
+        start = time.perf_counter()
+        errors = 0
+        try:
+            yield stage
+        except BaseException:
+            errors = 1
+            raise
+        finally:
+            self._record_stage(name, time.perf_counter() - start, stage["rows"], stage["bytes"], errors)
+    def _record_stage(self, name, seconds, rows=None, bytes=None, errors=0):
+        with self._stats_lock:
+            totals = self.stage_stats.setdefault(name, {"count": 0, "errors": 0, "seconds": 0.0, "rows": 0, "bytes": 0})
+            totals["count"] += 1
+            totals["errors"] += errors
+            totals["seconds"] += seconds
+            totals["rows"] += rows or 0
+            totals["bytes"] += bytes or 0
+        self._emit({"type": "stage", "name": name, "seconds": seconds, "rows": rows, "bytes": bytes, "errors": errors,
+                    "rows_per_second": rows / seconds if rows and seconds else None})
+    def _emit(self, event):
+        '''one metric event ({"type": "call"/"stage", "name", ...numbers}) to the debug log and every metrics hook
+        a hook that raises is logged and skipped, it never breaks the operation it is measuring'''
+        event["grid_id"] = self.grid_id
+        logger.debug("%s %s %.3fs", event["type"], event["name"], event["seconds"], extra={"grid_id": self.grid_id, "metric": event})
+        for hook in self.metrics_hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("metrics hook %r failed", hook, extra={"grid_id": self.grid_id})
+    def _dispatch(self, send, rows, max_rows=None, max_bytes=None, max_workers=None, call_name=None, progress=None, ordered=False, reverse=False, encoded=False):
+        '''sends a big list of row payloads as several requests:
+        1. splits rows into chunks of at most max_rows rows and max_bytes of serialized json (see _chunk_rows)
+        2. sends the chunks as send(chunk) from a thread pool of max_workers, each through _with_retry so every request
+           waits on the shared rate limiter (we run at the api quota, not at fixed sleeps) and each chunk retries on its own
+        encoded=True sends each chunk as its json body instead (the string _chunk_rows built while sizing it, see _rows_request)
+        ordered=True sends the chunks one at a time in chunk order (last chunk first with reverse=True) and stops at the first chunk
+        that fails, for adds, where the order the requests land in is the order the rows end up in on the sheet
+        returns the responses in chunk order. chunks that still failed after their retries are in self.failed_chunks
+        ({"index", "rows", "error"}), and once every chunk has finished the first of those errors is raised
+        progress, if given, is called as progress(chunks_done, chunks_total, rows_done) each time a chunk succeeds
+        inside a journaled() block, chunks the job already committed are skipped (their journaled responses stand in) and the rest
+        are journaled as they succeed
+        keep max_workers low: smartsheet only applies one write at a time per sheet, the rest come back as retryable 4004s'''
+        chunks, bodies = self._chunk_rows(rows, max_rows or self.max_chunk_rows, max_bytes or self.max_chunk_bytes)
+        payloads = bodies if encoded else chunks
+        results = [None] * len(chunks)
+        self.failed_chunks = []
+        if not chunks:
+            return results
 
-                elif 'Expecting value' in str(e):
-                    should_retry = True 
+        pending = list(range(len(chunks)))
+        chunks_done = rows_done = 0
+        if self._journal is not None:
+            journal_keys = [self._journal_key(call_name, body) for body in bodies]
+            committed = self._journal_committed(journal_keys)
+            pending = [i for i in pending if journal_keys[i] not in committed]
+            for i in set(range(len(chunks))) - set(pending):
+                results[i] = committed[journal_keys[i]]
+                chunks_done += 1
+                rows_done += len(chunks[i])
+            self._journal["skipped"] += chunks_done
+            if chunks_done:
+                logger.info("Job %s: %s/%s %s chunks already committed, sending the other %s", self._journal["job"], chunks_done, len(chunks), call_name, len(pending),
+                            extra={"grid_id": self.grid_id, "job": self._journal["job"], "call": call_name, "chunks_skipped": chunks_done, "chunks_pending": len(pending)})
+            if not pending:
+                return results
 
-                if should_retry and attempt < max_retries - 1:
-                    wait = retry_delay * (2 ** attempt)
-                    print(f"[Retry] Attempt {attempt + 1}/{max_retries} failed with error: {e}. Retrying in {wait}s...")
-                    time.sleep(wait)
-                else:
-                    raise    
+        def committed(i):
+            nonlocal chunks_done, rows_done
+            if self._journal is not None:
+                self._journal_record(journal_keys[i], call_name, len(chunks[i]), results[i])
+            chunks_done += 1
+            rows_done += len(chunks[i])
+            if progress:
+                progress(chunks_done, len(chunks), rows_done)
+
+        if ordered:
+            for i in (reversed(pending) if reverse else pending):
+                try:
+                    results[i] = self._with_retry(send, payloads[i], call_name=call_name)
+                except Exception as e:
+                    # sending the chunks after it would put their rows out of order
+                    self.failed_chunks.append({"index": i, "rows": len(chunks[i]), "error": e})
+                    break
+                committed(i)
+        else:
+            workers = min(max_workers or self.max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self._with_retry, send, payloads[i], call_name=call_name): i for i in pending}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        self.failed_chunks.append({"index": i, "rows": len(chunks[i]), "error": e})
+                        continue
+                    committed(i)
+        if self.failed_chunks:
+            self.failed_chunks.sort(key=lambda failed: failed["index"])
+            raise self.failed_chunks[0]["error"]
+        return results
+    def _chunk_rows(self, rows, max_rows, max_bytes):
+        '''splits rows into consecutive chunks of at most max_rows rows whose serialized size stays under max_bytes
+        returns (chunks, bodies): bodies[i] is chunks[i] as a json array, joined from the encodings that sized its rows, so each row
+        is serialized once'''
+        chunks = []
+        bodies = []
+        chunk = []
+        encoded = []
+        chunk_bytes = 0
+        with self._stage("chunk", rows=len(rows)) as stage:
+            stage["bytes"] = 0
+            for row in rows:
+                row_json = json.dumps(row, default=_json_default)
+                row_bytes = len(row_json)
+                if chunk and (len(chunk) >= max_rows or chunk_bytes + row_bytes > max_bytes):
+                    chunks.append(chunk)
+                    bodies.append("[" + ",".join(encoded) + "]")
+                    chunk = []
+                    encoded = []
+                    chunk_bytes = 0
+                chunk.append(row)
+                encoded.append(row_json)
+                chunk_bytes += row_bytes
+                stage["bytes"] += row_bytes
+            if chunk:
+                chunks.append(chunk)
+                bodies.append("[" + ",".join(encoded) + "]")
+        return chunks, bodies
+    def _posting_records(self, posting_data):
+        '''posting_data as a list of dicts: a DataFrame becomes one dict per row, its empty cells (NaN/NaT/None) as None'''
+        if isinstance(posting_data, pd.DataFrame):
+            return posting_data.astype(object).where(posting_data.notna(), None).to_dict("records")
+        return posting_data
+    def _row_payloads(self, posting_data, column_ids, row_ids=None, clear_blanks=False, strict=None, to_top=None):
+        '''every write builds its rows here, as plain json ready dicts instead of sdk Row/Cell models (see _rows_request)
+        column_ids = {title: column id} of the columns to send, keys of the row dicts that arent in it are left out
+        - dates are turned into iso strings first (see _coerce_dates)
+        - strings starting with "=" go as formulas, anything else as the value
+        - blanks (None/NaN) are left out of the row, or with clear_blanks=True sent as "" so the cell is emptied
+        - strict (None = leave it to the api) is set on every cell
+        - row_ids (updates) gives row i the id row_ids[i], to_top (adds) puts the rows at the top (True) or bottom (False)'''
+        posting_data = self._coerce_dates(posting_data)
+        column_ids = {title: int(column_id) for title, column_id in column_ids.items()}
+        location = {} if to_top is None else ({"toTop": True} if to_top else {"toBottom": True})
+        rows = []
+        with self._stage("payload", rows=len(posting_data)):
+            for i, data in enumerate(posting_data):
+                cells = []
+                for title, value in data.items():
+                    column_id = column_ids.get(title)
+                    if column_id is None:
+                        continue
+                    if value is None or (isinstance(value, float) and math.isnan(value)):
+                        if not clear_blanks:
+                            continue
+                        cell = {"columnId": column_id, "value": ""}
+                    elif isinstance(value, str) and value.startswith("="):
+                        cell = {"columnId": column_id, "formula": value}
+                    else:
+                        cell = {"columnId": column_id, "value": value}
+                    if strict is not None:
+                        cell["strict"] = strict
+                    cells.append(cell)
+                row = {"id": row_ids[i], "cells": cells} if row_ids is not None else {"cells": cells}
+                row.update(location)
+                rows.append(row)
+        return rows
+    def _rows_request(self, method, rows):
+        '''one POST (add) or PUT (update) /sheets/{id}/rows, returns the response as a dict:
+        {"message", "resultCode", "version", "result": [rows as the api stored them]}
+        rows is the rows from _row_payloads or, from _dispatch(encoded=True), their json body already built by _chunk_rows
+        (add_rows/update_rows would want Row/Cell models and walk them all to serialize them, the passthrough would parse our json back
+        into a JSONObject for requests to dump again). the body goes out as is on the client's session, prepared by the sdk (auth,
+        user agent, api_base), but not through client.request: its request logger parses and re-dumps every json body and response
+        even with logging off. errors are mapped to the sdk's exceptions the same way errors_as_exceptions does, for _with_retry'''
+        body = rows if isinstance(rows, str) else json.dumps(rows, default=_json_default)
+        operation = smartsheet.util.fresh_operation(f"{method.lower()}_rows")
+        operation["method"] = method
+        operation["path"] = f"/sheets/{self.grid_id}/rows"
+        operation["headers"]["Content-Type"] = "application/json"
+        operation["form_data"] = body.encode("utf-8")
+        try:
+            response = self.smart._session.send(self.smart.prepare_request(operation))
+        except requests.exceptions.RequestException as e:
+            raise smartsheet.exceptions.UnexpectedRequestError(e.request, e.response) from e
+        if 200 <= response.status_code <= 299:
+            return response.json()
+        error = smartsheet.smartsheet.OperationErrorResult(response.text, response).native("Error")
+        raise getattr(smartsheet.exceptions, error.result.name)(error, f"{error.result.code}: {error.result.message or 'Unknown error'}")
+#endregion
+#region job journal
+    @contextmanager
+    def journaled(self, job_id, path=None):
+        '''with grid_object.journaled("nightly load"): ... makes the bulk writes in the block resumable
+        every chunk _dispatch sends (post_new_rows, update_rows batch/diff, write_dataframe, deletes) is written to a sqlite journal
+        (path, default journal_path) under job_id as soon as it commits, along with the row ids the api returned for it.
+        if the block fails (a chunk still failing after its retries, the process killed, etc...), running the same job again with the
+        same job_id only sends the chunks that aren't in the journal, the journaled responses stand in for the rest
+        (so post_new_rows still indexes the rows those chunks made, and nothing gets posted twice)
+        the job's entries are dropped once the block finishes without an error, so the next run of it starts fresh
+        chunks are recognized by their content (call + payload + how many identical chunks the job sent before it), so the re-run has to
+        make the same calls with the same payloads: same data, same chunk settings. only what an earlier run committed is skipped, what
+        this run sends always goes out (writing the same rows twice in one block writes them twice)
+        a chunk the api applied but the journal never recorded (killed in between) is sent again
+        post_fresh's delete (and write_dataframe mode='replace' without a key) is a step of the job too, done once (see _fresh_delete)
+        the numbers end up in self.journal_report: {"job", "chunks_skipped", "chunks_sent"}'''
+        connection = sqlite3.connect(path or self.journal_path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("""CREATE TABLE IF NOT EXISTS chunks (
+            job TEXT, grid_id INTEGER, call TEXT, chunk TEXT, rows INTEGER, response TEXT, committed_at REAL,
+            PRIMARY KEY (job, grid_id, call, chunk))""")
+        # what earlier runs of the job committed, read once: the chunks this run commits are journaled but never skipped
+        committed = {(call, chunk): json.loads(response) for call, chunk, response in connection.execute(
+            "SELECT call, chunk, response FROM chunks WHERE job = ? AND grid_id = ?", (str(job_id), self.grid_id))}
+        outer = self._journal
+        self._journal = {"job": str(job_id), "connection": connection, "lock": threading.Lock(), "skipped": 0, "sent": 0,
+                         "committed": committed, "seen": Counter()}
+        try:
+            yield self
+            with self._journal["lock"]:
+                connection.execute("DELETE FROM chunks WHERE job = ? AND grid_id = ?", (str(job_id), self.grid_id))
+        finally:
+            self.journal_report = {"job": job_id, "chunks_skipped": self._journal["skipped"], "chunks_sent": self._journal["sent"]}
+            self._journal = outer
+            connection.close()
+    def _journal_key(self, call_name, body):
+        '''what identifies a chunk within a job: the call, a hash of its json body (from _chunk_rows) and its sequence number among
+        the identical chunks the job has sent so far (so sending the same rows twice journals two chunks)'''
+        digest = (call_name or "call", hashlib.sha256(body.encode()).hexdigest())
+        journal = self._journal
+        with journal["lock"]:
+            journal["seen"][digest] += 1
+            return (digest[0], f"{digest[1]}:{journal['seen'][digest]}")
+    def _journal_committed(self, keys):
+        '''{key: journaled response} for the keys an earlier run of this job committed'''
+        committed = self._journal["committed"]
+        return {key: committed[key] for key in keys if key in committed}
+    def _journal_record(self, key, call_name, rows, response):
+        '''journals one committed chunk, keeping just the row ids from its response (in the dict shape _index_new_rows reads)'''
+        data = response.to_dict() if hasattr(response, "to_dict") else response
+        data = data if isinstance(data, dict) else {}
+        result = data.get("result")
+        if isinstance(result, list):
+            # rows for adds/updates, plain ids for deletes
+            result = [{"id": row.get("id")} if isinstance(row, dict) else row for row in result]
+        kept = {"message": data.get("message"), "resultCode": data.get("resultCode"), "version": data.get("version"), "result": result, "journaled": True}
+        journal = self._journal
+        with journal["lock"]:
+            journal["connection"].execute("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                          (journal["job"], self.grid_id, key[0], key[1], rows, json.dumps(kept, default=_json_default), time.time()))
+            journal["sent"] += 1
 #endregion
 #region ss post
     #region new row(s)
@@ -235,101 +1361,177 @@ class grid:
         filtered column title list is a list of column title str to prep for posting (if you are not posting to all columns)
         [NOT USED INDEPENDENTLY, BUT USED INSIDE OF POST_NEW_ROWS]'''
 
-        column_df = self.get_column_df()
-
         if filtered_column_title_list == "all_columns":
-            filtered_column_title_list = column_df['title'].tolist()
-    
-        self.column_id_dict = {title: column_df.loc[column_df['title'] == title]['id'].tolist()[0] for title in filtered_column_title_list}
+            title_ids = self._column_title_ids()
+            filtered_column_title_list = list(title_ids)
+        else:
+            title_ids = self._column_title_ids_for(filtered_column_title_list)
+
+        self.column_id_dict = {title: title_ids[title] for title in filtered_column_title_list}
+    def _column_title_ids(self, refresh=False):
+        '''{column title: column id} for this sheet, from the schema cache (a get sheet response's titles do, see _cache_title_ids)'''
+        schema = None if refresh else self._cached_schema()
+        if schema is None:
+            self.get_column_df(refresh=True)
+            schema = grid._schema_cache[self.grid_id]
+        return schema["title_ids"]
+    def _column_title_ids_for(self, titles):
+        '''_column_title_ids, refreshed from the api once if any of titles isnt in the cached one, raises IndexError for titles
+        that still arent on the sheet'''
+        title_ids = self._column_title_ids()
+        if any(title not in title_ids for title in titles):
+            # might just be a column added since the schema was cached
+            title_ids = self._column_title_ids(refresh=True)
+            missing = [title for title in titles if title not in title_ids]
+            if missing:
+                raise IndexError(f"{missing} are not column titles on sheet {self.grid_id}")
+        return title_ids
+    @_timed("delete_all_rows", rows=lambda self: self.delete_report["rows"])
     def delete_all_rows(self):
-        '''deletes up to 400 rows in 200 row chunks by grabbing row ids and deleting them one at a time in a for loop
+        '''deletes every row in the sheet:
+        grabs just the row ids (fetch_row_ids, no cells/columns/df), then deletes them delete_chunk_rows at a time through _dispatch
+        (worker pool, shared rate limiter, per chunk retries), printing progress as chunks finish
+        the numbers end up in self.delete_report: {"rows", "chunks", "seconds", "rows_per_second"}
         [NOT USED INDEPENDENTLY, BUT USED INSIDE OF POST_NEW_ROWS]'''
-        self.fetch_content()
-
-        row_list_del = []
-        for rowid in self.df['id'].to_list():
-            row_list_del.append(rowid)
-            # Delete rows to sheet by chunks of 200
-            if len(row_list_del) > 199:
-                self.smart.Sheets.delete_rows(self.grid_id, row_list_del)
-                row_list_del = []
-        # Delete remaining rows
-        if len(row_list_del) > 0:
-            self.smart.Sheets.delete_rows(self.grid_id, row_list_del) 
+        self._delete_rows(self.fetch_row_ids())
+        # whatever was fetched before is gone now
+        if getattr(self, "df", None) is not None and getattr(self, "grid_rows", None) is not None:
+            self.df = self.df.iloc[0:0]
+            self.grid_rows[:] = []
+            self.grid_row_ids[:] = []
+        for entry in self._key_indexes.values():
+            entry["index"].clear()
+            entry["duplicates"].clear()
+    def _fresh_delete(self):
+        '''delete_all_rows ahead of posting rows (post_fresh)
+        inside a journaled() block the delete is a step of the job, journaled as the job's nth fresh delete: a re-run of the job
+        skips it once it committed, else it would delete the rows the committed add chunks already made and lose them'''
+        if self._journal is None:
+            return self.delete_all_rows()
+        key = self._journal_key("delete_all_rows", "")
+        if self._journal_committed([key]):
+            self._journal["skipped"] += 1
+            self.delete_report = {"rows": 0, "chunks": 0, "seconds": 0.0, "rows_per_second": None}
+            logger.info("Job %s: the sheet was already emptied for this post, not deleting again", self._journal["job"],
+                        extra={"grid_id": self.grid_id, "job": self._journal["job"], "call": "delete_all_rows"})
+            return
+        self.delete_all_rows()
+        self._journal_record(key, "delete_all_rows", self.delete_report["rows"], {"message": "SUCCESS", "result": None})
+    def _delete_rows(self, row_ids):
+        '''deletes these rows, delete_chunk_rows at a time through _dispatch, logging progress as chunks finish (see delete_all_rows)'''
+        start = time.monotonic()
+
+        def progress(chunks_done, chunks_total, rows_done):
+            elapsed = time.monotonic() - start
+            logger.info("Delete: %s/%s chunks, %s/%s rows (%.0f rows/s)", chunks_done, chunks_total, rows_done, len(row_ids), rows_done / max(elapsed, 1e-9),
+                        extra={"grid_id": self.grid_id, "chunks_done": chunks_done, "chunks_total": chunks_total, "rows_done": rows_done})
+
+        responses = self._dispatch(
+            # a retried chunk may already have been applied, rows that are gone already aren't an error
+            lambda chunk: self.smart.Sheets.delete_rows(self.grid_id, chunk, ignore_rows_not_found=True),
+            row_ids,
+            max_rows=self.delete_chunk_rows,
+            call_name="delete_rows",
+            progress=progress)
+
+        seconds = time.monotonic() - start
+        self.delete_report = {
+            "rows": len(row_ids),
+            "chunks": len(responses),
+            "seconds": seconds,
+            "rows_per_second": len(row_ids) / seconds if seconds else None,
+        }
+    @_timed("post_new_rows", rows=lambda self, posting_data, *args, **kwargs: len(posting_data))
     def post_new_rows(self, posting_data, post_fresh = False, post_to_top=False):
         '''posts new row to sheet, does not account for various column types at the moment (though date is just str w '%Y-%m-%dT%H:%M:%S format)
         posting data is a list of dictionaries, one per row, where the key is the name of the column, and the value is the value you want to post
         then this function creates a second dictionary holding each column's id, and then posts the data one dictionary at a time (each is a row)
         post_to_top = the new row will appear on top, else it will appear on bottom
         post_fresh = first delete the whole sheet, then post (else it will just update existing sheet)
+        posting_data can also be a DataFrame (one row per row, empty cells are left out)
+        rows are built by _row_payloads and go out in chunks through _dispatch, self.post_response is the list of add rows responses (dicts)
         TODO: if using post_to_top==False, I should really delete the empty rows in the sheet so it will properly post to bottom'''
         
-        posting_sheet_id = self.grid_id
+        posting_data = self._posting_records(posting_data)
         column_title_list = list(posting_data[0].keys())
         try:
             self.grab_posting_column_ids(column_title_list)
         except IndexError:
             raise ValueError("Index Error reveals that your posting_data dictionary has key(s) that don't match the column names on the Smartsheet")
+        rows = self._row_payloads(posting_data, self.column_id_dict, to_top=post_to_top)
         if post_fresh:
-            self.delete_all_rows()
-        
-        rows = []
+            self._fresh_delete()
 
-        for item in posting_data:
-            row = smartsheet.models.Row()
-            row.to_top = post_to_top
-            row.to_bottom= not(post_to_top)
-            for key in self.column_id_dict:
-                if self.is_date_like(item[key]):
-                    date_format = self.parse_to_iso8601(item[key])
-                    item[key] = date_format
-                if item.get(key) != None:     
-                    row.cells.append({
-                    'column_id': self.column_id_dict[key],
-                    'value': item[key]
-                    })
-            rows.append(row)
-
-        self.post_response = self._with_retry(lambda: self.smart.Sheets.add_rows(posting_sheet_id, rows))
+        # one add rows request per chunk (see _dispatch), so post_response is the list of responses in chunk order
+        # one at a time so the rows land in posting_data's order, to the top that means the last chunk goes first
+        try:
+            self.post_response = self._dispatch(lambda body: self._rows_request("POST", body), rows, call_name="add_rows",
+                                                ordered=True, reverse=post_to_top, encoded=True)
+        except Exception:
+            # some chunks may have made their rows, the key indexes don't know them: rebuild from a fetch on the next upsert
+            for entry in self._key_indexes.values():
+                entry["version"] = None
+            raise
+        self._index_new_rows(posting_data, self.post_response)
         self.handle_update_stamps()
     #endregion
     #region post timestamp
     def handle_update_stamps(self):
-        '''safe update stamp without blowing away self.df'''
+        '''posts today's date to the "Last API Automation" summary field
+        inside a deferred_stamps() block this only notes that a stamp is due, the block writes it once on the way out'''
+        if self._stamp_depth:
+            self._stamp_pending = True
+            return
         current_date = datetime.date.today()
         formatted_date = current_date.strftime('%m/%d/%y')
 
-        # Save the current df (row-based data)
-        original_df = self.df.copy()
-
         sum_id = self.grabrcreate_sum_id("Last API Automation", "DATE")
-        self.post_to_summary_field(sum_id, formatted_date)
-
-        # Restore df after it gets overwritten by summary content
-        self.df = original_df
+        try:
+            self.post_to_summary_field(sum_id, formatted_date)
+        except Exception:
+            # the cached id may belong to a field someone has since deleted, look it up again before giving up
+            grid._summary_field_ids.pop((self.grid_id, "Last API Automation"), None)
+            fresh_id = self.grabrcreate_sum_id("Last API Automation", "DATE")
+            if fresh_id == sum_id:
+                raise
+            self.post_to_summary_field(fresh_id, formatted_date)
+    @contextmanager
+    def deferred_stamps(self):
+        '''with grid_object.deferred_stamps(): ... holds back every handle_update_stamps() in the block and stamps once when it finishes,
+        so a bulk operation (several post_new_rows/update_rows calls) costs one stamp instead of one per call
+        blocks can nest, only the outermost one stamps, and nothing is stamped if the block raises'''
+        self._stamp_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._stamp_depth == 1:
+                self._stamp_pending = False
+            raise
+        finally:
+            self._stamp_depth -= 1
+        if self._stamp_depth == 0 and self._stamp_pending:
+            self._stamp_pending = False
+            self.handle_update_stamps()
     def grabrcreate_sum_id(self, field_name_str, sum_type):
-        '''checks if there is a DATE summary field called "Last API Automation", if Y, pulls id, if N, creates the field.
-        then posts today's date to that field
+        '''checks if there is a summary field called field_name_str, if Y, pulls id, if N, creates the field.
+        ids are cached per (sheet, title) in grid._summary_field_ids, so after the first lookup this costs no api calls
         [ONLY TESTED FOR DATE FIELDS FOR NOW]'''
-        # First, let's fetch the current summary fields of the sheet
-        self.fetch_summary_content()
-
-        # Check if "Last API Automation" summary field exists
-        automation_field = self.df[self.df['title'] == field_name_str]
+        cache_key = (self.grid_id, field_name_str)
+        if cache_key not in grid._summary_field_ids:
+            # fills the cache with every summary field on the sheet
+            self.fetch_summary_content()
 
         # If it doesn't exist, create it
-        if automation_field.empty:
+        if cache_key not in grid._summary_field_ids:
             new_field = smartsheet.models.SummaryField({
                 "title": field_name_str,
                 "type": sum_type
             })
-            response = self._with_retry(lambda: self.smart.Sheets.add_sheet_summary_fields(self.grid_id, [new_field]))
+            response = self._with_retry(lambda: self.smart.Sheets.add_sheet_summary_fields(self.grid_id, [new_field]), call_name="add_sheet_summary_fields")
             # Assuming the response has the created field's data, extract its ID
-            self.sum_id = response.data[0].id
-        else:
-            # Extract the ID from the existing field
-            self.sum_id = automation_field['id'].values[0]
+            grid._summary_field_ids[cache_key] = response.data[0].id
 
+        self.sum_id = grid._summary_field_ids[cache_key]
         return self.sum_id
     def post_to_summary_field(self, sum_id, post):
         '''posts to sum field, 
@@ -340,204 +1542,600 @@ class grid:
             "id": int(sum_id),
             "ObjectValue": post
         })
-        resp = self.smart.Sheets.update_sheet_summary_fields(
+        resp = self._with_retry(lambda: self.smart.Sheets.update_sheet_summary_fields(
             self.grid_id,    # sheet_id
             [sum],
             False    # rename_if_conflict
-        )
+        ), call_name="update_sheet_summary_fields")
     #endregion
     #region post row update
-    def grab_posting_row_ids(self, posting_data, primary_key, skip_nonmatch=False):
+    def grab_posting_row_ids(self, posting_data, primary_key, skip_nonmatch=False, fetch=None, normalize=None):
         '''Prepares for an update by reorganizing the posting data with the row_id as the key and the value as the data.    
 
         Parameters:
         - posting_data: Dictionary where each key is a column name and each value is the corresponding row value for that column.
         - primary_key: A key from `posting_data` that serves as the reference to map row IDs to the posting data (must be case-sensitive match). 
             In otherwords, the primary_key is a str that matches one of the keys from the posting_data. This key represents the column that will be used to extract Row_IDs by finding the first row to match each posting_data's primary key value, and calling that the row Id for that dictionary
+            A list/tuple of column names makes a composite key, rows match when every one of those columns matches.
         - skip_nonmatch (optional, default=True): Determines the handling of non-matching primary keys. When set to `True`, rows with non-matching primary keys are ignored. When `False`, these rows are collected into a "new_rows" key in the resulting dictionary.  
+        - fetch (optional, default=None): None reuses this session's key index when it is still current (see _key_index) and only fetches
+            when there isnt one, True always fetch_content first, False when the caller just fetched.
+        - normalize (optional): normalize(value, column_type) -> hashable, how key values are compared (default grid.key_normalizer or _normalize_key,
+            which matches 5/5.0/" 5 ", trims text and compares dates as dates)
 
         Process:
         1. Identify the value associated with the `primary_key` in `posting_data`.
         2. Search for this value in the Smartsheet to find its row_id.
         3. Return a dictionary: keys are row_ids (or "new_rows" for unmatched rows), values are the corresponding `posting_data` for each row.
+        Keys that appear on more than one sheet row match the first of them and are reported in self.duplicate_keys (and the log).
         '''
+        key_columns = self._key_columns(primary_key)
+        entry = self._key_index(key_columns, normalize, fetch)
+        self.duplicate_keys = {self._report_key(key): row_ids for key, row_ids in entry["duplicates"].items()}
 
-        self.fetch_content()
-
-        if not self.df.empty:
-            # Mapping of the primary key values to their corresponding row IDs from the current Smartsheet data
-            primary_to_row_id = dict(zip(self.df[primary_key], self.df['id']))  
+        # Dictionary to hold the mapping of row IDs to their posting data
+        update_data = {}
+        new_rows = []   
 
-            # Dictionary to hold the mapping of row IDs to their posting data
-            update_data = {}
-            new_rows = []   
+        for data in posting_data:
+            key = self._row_key(data, entry)
+            if key is not None and key in entry["index"]:
+                update_data[entry["index"][key]] = data
+            elif not skip_nonmatch:
+                new_rows.append(data)   
 
-            for data in posting_data:
-                primary_value = data.get(primary_key)
-                if isinstance(primary_value, int):
-                    primary_value = str(primary_value)
-                    # JUST ADDED!!
-                if primary_value in primary_to_row_id:
-                    row_id = primary_to_row_id[primary_value]
-                    update_data[row_id] = data
-                elif not skip_nonmatch:
-                    new_rows.append(data)   
+        if new_rows:
+            update_data['new_rows'] = new_rows  
 
-            if new_rows:
-                update_data['new_rows'] = new_rows  
+        # Check if there were no matches at all
+        if not update_data:
+            raise ValueError(f"The primary_key '{primary_key}' had no matches in the current Smartsheet data.") 
 
-            # Check if there were no matches at all
-            if not update_data:
-                raise ValueError(f"The primary_key '{primary_key}' had no matches in the current Smartsheet data.") 
-
-            return update_data
-        else:
-            raise ValueError("Grid Instance is not appropriate for this task. Try create a new grid instance")
+        return update_data
+    def key_index(self, primary_key, normalize=None, fetch=None):
+        '''{normalized key: row id} for primary_key (a column name, or a list of them for a composite key, keys are then tuples)
+        the same index update_rows uses, see grab_posting_row_ids for fetch/normalize'''
+        entry = self._key_index(self._key_columns(primary_key), normalize, fetch)
+        if len(entry["columns"]) == 1:
+            return {key[0]: row_id for key, row_id in entry["index"].items()}
+        return dict(entry["index"])
+    def _key_columns(self, primary_key):
+        return (primary_key,) if isinstance(primary_key, str) else tuple(primary_key)
+    def _key_index(self, key_columns, normalize=None, fetch=None):
+        '''the key index for these key columns: {"columns", "types", "normalize", "index": {key tuple: row id},
+        "duplicates": {key tuple: [row ids]}, "version"}
+        built from df once per sheet version, after that post_new_rows adds the rows it creates from the add_rows responses
+        (update_rows never reposts key columns, so updates can't move a key), so repeated upserts in one session don't refetch.
+        changes made to the sheet by someone else are only picked up by a fetch (fetch=True, or any fetch_content that moves the version)'''
+        normalize = normalize or type(self).key_normalizer or grid._normalize_key
+        cache_key = (key_columns, normalize)
+        entry = self._key_indexes.get(cache_key)
+        current = entry is not None and entry["version"] == self.grid_version and getattr(self, "df", None) is not None and not self.partial_content
+        # a partial df (fetch_content(columns=/row_ids=/filter_id=)) can't be trusted for keys, even with fetch=False
+        if fetch or (not current and (fetch is None or self.partial_content)):
+            self.fetch_content()
+            entry = self._key_indexes.get(cache_key)
+        if entry is None or entry["version"] != self.grid_version:
+            entry = self._build_key_index(key_columns, normalize)
+            self._key_indexes[cache_key] = entry
+        return entry
+    def _build_key_index(self, key_columns, normalize):
+        missing = [column for column in key_columns if column not in self.df.columns]
+        if missing:
+            raise ValueError(f"Grid Instance is not appropriate for this task, the sheet has no column(s) {missing}")
+        column_types = dict(zip(self.column_df["title"], self.column_df["type"])) if getattr(self, "column_df", None) is not None else {}
+        types = [column_types.get(column) for column in key_columns]
+        columns = [[normalize(value, column_type) for value in self.df[column].tolist()] for column, column_type in zip(key_columns, types)]
+        index = {}
+        duplicates = {}
+        for key, row_id in zip(zip(*columns), self.df["id"].tolist()):
+            if all(part is None for part in key):
+                # blank keys never match anything
+                continue
+            if key in index:
+                duplicates.setdefault(key, [index[key]]).append(row_id)
+            else:
+                index[key] = row_id
+        if duplicates:
+            logger.warning("%s key(s) on more than one row for %s, updates go to the first row of each: %s", len(duplicates), list(key_columns),
+                           list(duplicates.items())[:5], extra={"grid_id": self.grid_id, "key_columns": list(key_columns), "duplicates": len(duplicates)})
+        return {"columns": key_columns, "types": types, "normalize": normalize, "index": index, "duplicates": duplicates, "version": self.grid_version}
+    def _row_key(self, data, entry):
+        key = tuple(entry["normalize"](data.get(column), column_type) for column, column_type in zip(entry["columns"], entry["types"]))
+        return None if all(part is None for part in key) else key
+    def _report_key(self, key):
+        return key[0] if len(key) == 1 else key
+    def _index_new_rows(self, posting_data, responses):
+        '''adds rows post_new_rows just created to every current key index, pairing each posted row with the row id
+        the add_rows responses returned for it (same order)'''
+        entries = [entry for entry in self._key_indexes.values() if entry["version"] == self.grid_version]
+        if not entries:
+            return
+        row_ids = []
+        for response in responses:
+            result = getattr(response, "result", None)
+            if result is None and isinstance(response, dict):
+                result = response.get("result")
+            if result is None:
+                continue
+            # a list (TypedList from the sdk) of rows, or a single row for a one row request
+            for row in ([result] if isinstance(result, dict) or hasattr(result, "id") else result):
+                row_ids.append(row.get("id") if isinstance(row, dict) else getattr(row, "id", None))
+        if len(row_ids) != len(posting_data) or None in row_ids:
+            # can't pair them up, let the next upsert rebuild from a fetch
+            for entry in entries:
+                entry["version"] = None
+            return
+        for entry in entries:
+            for data, row_id in zip(posting_data, row_ids):
+                key = self._row_key(data, entry)
+                if key is None:
+                    continue
+                if key in entry["index"]:
+                    entry["duplicates"].setdefault(key, [entry["index"][key]]).append(row_id)
+                else:
+                    entry["index"][key] = row_id
+    @staticmethod
+    def _normalize_key(value, column_type=None):
+        '''default key normalization: None/blank/NaN -> None, text trimmed, whole numbers as int text (5, 5.0, "5" typed or not -> "5"
+        only for actual numbers, the string "05" stays "05"), checkboxes as bool, DATE/DATETIME columns as iso dates'''
+        if value is None:
+            return None
+        if isinstance(value, bool) or column_type == "CHECKBOX":
+            if isinstance(value, str):
+                return value.strip().lower() in ("true", "1", "yes", "checked")
+            return bool(value)
+        if isinstance(value, numbers.Integral):
+            return str(int(value))
+        if isinstance(value, numbers.Real):
+            if math.isnan(value):
+                return None
+            return str(int(value)) if float(value).is_integer() else repr(float(value))
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            if pd.isna(value):
+                return None
+            if column_type == "DATE" and isinstance(value, datetime.datetime):
+                return value.date().isoformat()
+            return value.isoformat()
+        if not isinstance(value, str) and pd.isna(value):
+            return None
+        text = str(value).strip()
+        if text == "":
+            return None
+        if column_type in ("DATE", "DATETIME", "ABSTRACT_DATETIME"):
+            parsed = _parse_date(text)
+            if parsed is not None:
+                return parsed.date().isoformat() if column_type == "DATE" else parsed.isoformat()
+        return text
+    @_timed("update_rows", rows=lambda self, posting_data, *args, **kwargs: len(posting_data))
     def update_rows(self, posting_data, primary_key, update_type='default'):
         '''
         Updates rows (and adds misc rows) in the Smartsheet based on the provided posting data.  
 
         Parameters:
-        - posting_data (list of dicts)
-        - primary_key (string which is equal to a key of one of the items in all dictionaries)
+        - posting_data (list of dicts, or a DataFrame)
+        - primary_key (string which is equal to a key of one of the items in all dictionaries, or a list of them for a composite key)
+        - update_type: 'default' (one request), 'batch' (350 row chunks), 'debug' (one row at a time, printed),
+            'diff' (only the cells whose value differs from what is on the sheet, see _diff_key)
 
         Returns:
         None. Updates and possibly adds rows in the Smartsheet.
+        With update_type='diff', the summary of what changed (also kept as self.update_summary):
+        {"rows_matched": int, "rows_changed": int, "cells_changed": int, "changes": {row_id: {column: {"old": ..., "new": ...}}}}
         '''
-        posting_sheet_id = self.grid_id
+        posting_data = self._posting_records(posting_data)
         column_title_list = list(posting_data[0].keys())
         try:
             self.grab_posting_column_ids(column_title_list)
         except IndexError:
             raise ValueError("Index Error reveals that your posting_data dictionary has key(s) that don't match the column names on the Smartsheet")
-        self.update_data = self.grab_posting_row_ids(posting_data, primary_key)
+        # key columns are left alone, they are only used to find the rows (see _key_index)
+        key_columns = self._key_columns(primary_key)
+        if update_type == 'diff':
+            # the diff compares against every row's raw cells (grid_content), so it needs a full fetch, not a sync, pages or a snapshot
+            self._fetch_raw_rows()
+            self.update_data = self.grab_posting_row_ids(posting_data, primary_key, fetch=False)
+        else:
+            self.update_data = self.grab_posting_row_ids(posting_data, primary_key)
+
+        # every branch sends rows built by _row_payloads: no key columns, formulas as formulas, None empties the cell, strict off
+        update_columns = {title: column_id for title, column_id in self.column_id_dict.items() if title not in key_columns}
+        row_ids = [row_id for row_id in self.update_data if row_id != "new_rows"]
 
         if update_type =='debug':
-            # Handle existing rows' updates (printing each row)
-            for i, row_id in enumerate(self.update_data.keys()):
-                if row_id != "new_rows":
-                    # Build the row to update
-                    new_row = smartsheet.models.Row()
-                    new_row.id = row_id
-                    for column_name in self.column_id_dict.keys():
-                        # does not post repost primary key
-                        if column_name != primary_key:
-                            print(column_name, int(self.column_id_dict[column_name]))
-                            # Build new cell value
-                            new_cell = smartsheet.models.Cell()
-                            new_cell.column_id = int(self.column_id_dict[column_name])
-                            # stops error where post doesnt go through because value is "None"
-                            value = self.update_data[row_id].get(column_name)
-                            if value != None:
-                                print(f"{i+1}/{len(self.update_data.keys())}  ", value)
-                                if value.startswith("="):
-                                    new_cell.formula = value
-                                else:
-                                    if self.is_date_like(value):
-                                        date_formatted_value = self.parse_to_iso8601(value)
-                                        value = date_formatted_value
-                                    new_cell.value = value
-                            else:
-                                new_cell.value = ""
-                            new_cell.strict = False
-                            new_row.cells.append(new_cell)
-
-                    # Update rows
-                    self.update_response = self._with_retry(lambda: self.smart.Sheets.update_rows(
-                      posting_sheet_id ,      # sheet_id
-                      [new_row]))
-                    
+            # Handle existing rows' updates (one request and log line per row)
+            for i, row_id in enumerate(row_ids):
+                logger.info("%s/%s %s", i+1, len(row_ids), self.update_data[row_id], extra={"grid_id": self.grid_id, "row_id": row_id})
+                rows = self._row_payloads([self.update_data[row_id]], update_columns, row_ids=[row_id], clear_blanks=True, strict=False)
+                self.update_response = self._with_retry(lambda: self._rows_request("PUT", rows), call_name="update_rows")
+
         elif update_type == 'batch':
-            rows = []
-            counter = 1
-            batch_total = int(math.ceil(len(self.update_data.keys()) / 350))
-            self.update_response = []       
-
-            for i, row_id in enumerate(self.update_data.keys()):
-                if row_id != "new_rows":
-                    new_row = smartsheet.models.Row()
-                    new_row.id = row_id
-                    for column_name in self.column_id_dict.keys():
-                        if column_name != primary_key:
-                            value = self.update_data[row_id].get(column_name)
-                            if value.startswith('='):
-                                new_cell = smartsheet.models.Cell()
-                                new_cell.column_id = int(self.column_id_dict[column_name])
-                                new_cell.formula = value  # Use get method to handle None
-                                new_cell.strict = False
-                                new_row.cells.append(new_cell)
-                            else:
-                                new_cell = smartsheet.models.Cell()
-                                new_cell.column_id = int(self.column_id_dict[column_name])
-                                if self.is_date_like(value):
-                                    date_formatted_value = self.parse_to_iso8601(value)
-                                    value = date_formatted_value
-                                new_cell.value = value  # Use get method to handle None
-                                new_cell.strict = False
-                                new_row.cells.append(new_cell)
-                    rows.append(new_row)  # Properly add the new_row to the rows list       
-
-                # When 350 rows are collected or at the end of the data
-                if (i + 1) % 350 == 0 or (i + 1) == len(self.update_data.keys()):
-                    # Send the batch update
-                    self.update_response.append(self.smart.Sheets.update_rows(
-                        posting_sheet_id,
-                        rows  # Now passing the entire list of rows
-                    ))
-                    print(f"Batch {counter}/{batch_total}: updated {i + 1}/{len(self.update_data.keys())} in smartsheet")
-                    time.sleep(2)  # Optional: sleep to avoid hitting rate limits or as needed
-                    counter += 1
-                    rows = []  # Reset the rows list for the next batch     
-
-            # After the loop, check if there's any leftover rows to update
-            if rows:
-                self.update_response.append(self.smart.Sheets.update_rows(
-                    posting_sheet_id,
-                    rows
-                ))
-                print(f"Final batch: updated remaining {len(rows)} rows in smartsheet")
+            rows = self._row_payloads([self.update_data[row_id] for row_id in row_ids], update_columns, row_ids=row_ids, clear_blanks=True, strict=False)
+
+            # chunks of up to 350 rows go out max_workers at a time, paced by the shared rate limiter instead of sleeping between them
+            self.update_response = self._dispatch(lambda body: self._rows_request("PUT", body), rows, call_name="update_rows", encoded=True)
+            logger.info("Batch: updated %s rows in %s chunks in smartsheet", len(rows), len(self.update_response),
+                        extra={"grid_id": self.grid_id, "rows": len(rows), "chunks": len(self.update_response)})
 
-        
         elif update_type == 'default':
-            rows = []
-            # Handle existing rows' updates
-            for row_id in self.update_data.keys():
-                if row_id != "new_rows":
-                    # Build the row to update
-                    new_row = smartsheet.models.Row()
-                    new_row.id = row_id
-                    for column_name in self.column_id_dict.keys():
-                        # does not post repost primary key
-                        if column_name != primary_key:
-                            # Build new cell value
-                            new_cell = smartsheet.models.Cell()
-                            new_cell.column_id = int(self.column_id_dict[column_name])
-                            # stops error where post doesnt go through because value is "None"
-                            value = self.update_data[row_id].get(column_name)
-                            if value != None:
-                                if value.startswith("="):
-                                    new_cell.formula = value
-                                else:
-                                    if self.is_date_like(value):
-                                        date_formatted_value = self.parse_to_iso8601(value)
-                                        value = date_formatted_value
-                                    new_cell.value = value
-                            else:
-                                new_cell.value = ""
-                            new_cell.strict = False
-                            new_row.cells.append(new_cell)
-                    rows.append(new_row)
-
-            # Update rows
-            self.update_response = self._with_retry(lambda: self.smart.Sheets.update_rows(
-              posting_sheet_id ,      # sheet_id
-              rows))
+            rows = self._row_payloads([self.update_data[row_id] for row_id in row_ids], update_columns, row_ids=row_ids, clear_blanks=True, strict=False)
 
-        try:
+            # Update rows, all in one request
+            self.update_response = self._with_retry(lambda: self._rows_request("PUT", rows), call_name="update_rows") if rows else None
+
+        elif update_type == 'diff':
+            column_types = dict(zip(self.column_df['title'], self.column_df['type']))
+            sheet_cells = {row.get("id"): {cell.get("columnId"): cell for cell in row.get("cells")}
+                           for row in ((self.grid_content).get("rows") or [])}
+            self.update_summary = {"rows_matched": 0, "rows_changed": 0, "cells_changed": 0, "changes": {}}
+            changed_data = []
+            changed_ids = []
+            for row_id in row_ids:
+                data = self.update_data[row_id]
+                self.update_summary["rows_matched"] += 1
+                cells = sheet_cells.get(row_id, {})
+                changes = {}
+                for column_name, column_id in update_columns.items():
+                    column_type = column_types.get(column_name)
+                    value = data.get(column_name)
+                    cell = cells.get(int(column_id), {})
+                    old_value = cell.get("formula", cell.get("value"))
+                    if self._diff_key(value, column_type) == self._diff_key(old_value, column_type):
+                        continue
+                    changes[column_name] = {"old": old_value, "new": value}
+                # rows with nothing to change don't get sent at all, the rest only send their changed cells
+                if changes:
+                    changed_data.append({column_name: change["new"] for column_name, change in changes.items()})
+                    changed_ids.append(row_id)
+                    self.update_summary["changes"][row_id] = changes
+                    self.update_summary["rows_changed"] += 1
+                    self.update_summary["cells_changed"] += len(changes)
+            rows = self._row_payloads(changed_data, update_columns, row_ids=changed_ids, clear_blanks=True, strict=False)
+
+            self.update_response = self._dispatch(lambda body: self._rows_request("PUT", body), rows, call_name="update_rows", encoded=True)
+
+        # one stamp for the updates and the new rows together
+        with self.deferred_stamps():
             # Handle addition of new rows if the "new_rows" key is present
-            self.post_new_rows(self.update_data.get('new_rows'))
+            if self.update_data.get('new_rows'):
+                self.post_new_rows(self.update_data.get('new_rows'))
             self.handle_update_stamps()
-        except TypeError:
-            pass
+        if update_type == 'diff':
+            return self.update_summary
+    def _diff_key(self, value, column_type):
+        '''normalizes a value (from posting_data or a sheet cell) so equal content compares equal:
+        blank/None/NaN -> None, formulas compared as text, checkboxes as bool, DATE/DATETIME columns as iso dates,
+        actual numbers as their number text like _normalize_key (so 5, 5.0 and "5" match), everything else as stripped text
+        text is never parsed as a number: "01234", "1e3" or a 17 digit id don't match 1234, 1000 or a neighbouring id'''
+        if value is None or (isinstance(value, str) and value.strip() == ""):
+            return None
+        if isinstance(value, str) and value.startswith("="):
+            return ("formula", value.strip())
+        if column_type == "CHECKBOX":
+            if isinstance(value, str):
+                return value.strip().lower() in ("true", "1", "yes", "checked")
+            return bool(value)
+        if column_type in ("DATE", "DATETIME", "ABSTRACT_DATETIME") and not isinstance(value, bool):
+            try:
+                parsed = value if isinstance(value, (datetime.date, datetime.datetime)) else dateutil_parser.parse(str(value), fuzzy=False)
+                if column_type == "DATE" and isinstance(parsed, datetime.datetime):
+                    parsed = parsed.date()
+                return ("date", parsed.isoformat())
+            except (ValueError, TypeError, OverflowError):
+                pass
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            return self._normalize_key(value)
+        return str(value).strip()
+    #endregion
+    #region dataframe write back
+    @_timed("write_dataframe", rows=lambda self, df, *args, **kwargs: len(df))
+    def write_dataframe(self, df, key=None, mode='upsert', changed_only=True):
+        '''
+        Writes a DataFrame to the sheet in one call, as few bulk requests as the data needs.
+
+        Parameters:
+        - df: one row per sheet row, columns named like the sheet's columns. an "id" column (like fetch_content's df has) and columns
+            the api won't write (column formulas, system columns) are left out, so a fetched df can be edited and written straight back
+        - key: the column (or list of columns) that identifies a row, matched the same way update_rows matches (see _key_index)
+        - mode: 'upsert' (update the rows whose key is on the sheet, add the rest), 'replace' (upsert, then delete the sheet rows
+            whose key isnt in df, without a key: empty the sheet and post df) or 'append' (post every row, key or not)
+        - changed_only: only send the cells that differ from the sheet (compared like update_type='diff'), rows with no changes aren't sent
+            a cell counts as unchanged when df has its value, its display value (what an untyped fetch shows) or, for formulas, the formula
+
+        df is mapped to column ids once and aligned to the sheet by key with one merge against the key index, the values are
+        compared column by column, then the updates, adds and deletes each go out in chunks through _dispatch
+        rows with a blank key are always added, a key on more than one df row raises ValueError
+
+        Returns:
+        self.write_summary: {"mode", "rows", "updated", "cells_updated", "unchanged", "added", "deleted", "requests"}
+        '''
+        if self.token == None:
+            return "MUST SET TOKEN"
+        if mode not in ("upsert", "replace", "append"):
+            raise ValueError(f"mode must be 'upsert', 'replace' or 'append', not {mode!r}")
+        if key is None and mode == "upsert":
+            raise ValueError("mode='upsert' needs key= (the column or columns that identify a row)")
+        calls_before = sum(stats["calls"] for stats in self.call_stats.values())
+        # a fetched df's "id" column holds row ids, it isn't a sheet column
+        titles = [title for title in df.columns if title != "id" and title not in self._read_only_columns()]
+        try:
+            self.grab_posting_column_ids(titles)
+        except IndexError:
+            raise ValueError("Index Error reveals that your DataFrame has column(s) that don't match the column names on the Smartsheet")
+        column_ids = dict(self.column_id_dict)
+        frame = df[titles]
+        summary = {"mode": mode, "rows": len(frame), "updated": 0, "cells_updated": 0, "unchanged": 0, "added": 0, "deleted": 0}
+
+        # one stamp for the whole write
+        with self.deferred_stamps():
+            if key is None or mode == "append":
+                if len(frame):
+                    # post_fresh, so a journaled re-run doesn't empty the sheet again after some of the adds committed
+                    self.post_new_rows(frame, post_fresh=mode == "replace")
+                elif mode == "replace":
+                    self.delete_all_rows()
+                if mode == "replace":
+                    summary["deleted"] = self.delete_report["rows"]
+                summary["added"] = len(frame)
+            else:
+                key_columns = self._key_columns(key)
+                missing = [column for column in key_columns if column not in titles]
+                if missing:
+                    raise ValueError(f"key column(s) {missing} are not in the DataFrame")
+                # a full fetch: the raw cells to compare against and a key index as of now
+                self._fetch_raw_rows()
+                row_ids = self._align_keys(frame, self._key_index(key_columns, fetch=False))
+
+                changes = self._changed_cells(frame, row_ids, [title for title in titles if title not in key_columns], changed_only)
+                matched = sum(row_id is not None for row_id in row_ids)
+                if changes:
+                    rows = self._row_payloads([changes[i] for i in sorted(changes)], column_ids,
+                                              row_ids=[row_ids[i] for i in sorted(changes)], clear_blanks=True, strict=False)
+                    self.update_response = self._dispatch(lambda body: self._rows_request("PUT", body), rows, call_name="update_rows", encoded=True)
+                summary["updated"] = len(changes)
+                summary["cells_updated"] = sum(len(cells) for cells in changes.values())
+                summary["unchanged"] = matched - len(changes)
+
+                new_rows = [i for i, row_id in enumerate(row_ids) if row_id is None]
+                if new_rows:
+                    self.post_new_rows(frame.iloc[new_rows])
+                summary["added"] = len(new_rows)
+
+                if mode == "replace":
+                    kept = set(row_id for row_id in row_ids if row_id is not None)
+                    doomed = [row_id for row_id in self.grid_row_ids if row_id not in kept]
+                    if doomed:
+                        self._delete_rows(doomed)
+                        # the deleted rows' keys are still in the indexes, rebuild them on the next upsert
+                        for entry in self._key_indexes.values():
+                            entry["version"] = None
+                    summary["deleted"] = len(doomed)
+            # nothing written, nothing to stamp
+            if summary["updated"] or summary["added"] or summary["deleted"]:
+                self.handle_update_stamps()
+
+        summary["requests"] = sum(stats["calls"] for stats in self.call_stats.values()) - calls_before
+        self.write_summary = summary
+        logger.info("write_dataframe (%s): %s updated, %s added, %s deleted, %s unchanged in %s requests", mode, summary["updated"], summary["added"],
+                    summary["deleted"], summary["unchanged"], summary["requests"], extra={"grid_id": self.grid_id, "write_summary": summary})
+        return summary
+    def _read_only_columns(self):
+        '''titles of the columns the api won't take values for: column formulas and system columns (auto number, created by, etc...)'''
+        column_df = self.get_column_df()
+        read_only = pd.Series(False, index=column_df.index)
+        for flag in ("formula", "systemColumnType"):
+            if flag in column_df:
+                read_only |= column_df[flag].notna() & (column_df[flag] != False)
+        return set(column_df.loc[read_only, "title"])
+    def _align_keys(self, frame, entry):
+        '''the sheet row id for each row of frame (None = not on the sheet): frame's keys are normalized like the key index's
+        and left merged against it, raises ValueError when a key is on more than one row of frame'''
+        key_names = [f"key {j}" for j in range(len(entry["columns"]))]
+        left = pd.DataFrame({name: [entry["normalize"](value, column_type) for value in frame[column].tolist()]
+                             for name, column, column_type in zip(key_names, entry["columns"], entry["types"])})
+        blank = left.isna().all(axis=1)
+        repeated = left.duplicated(keep=False) & ~blank
+        if repeated.any():
+            keys = list(dict.fromkeys(tuple(key) for key in left[repeated].itertuples(index=False)))
+            raise ValueError(f"{len(keys)} key(s) are on more than one row of the DataFrame: {[self._report_key(key) for key in keys[:5]]}")
+        right = pd.DataFrame(list(entry["index"]), columns=key_names)
+        right["row id"] = pd.Series(list(entry["index"].values()), dtype=object)
+        aligned = left.merge(right, how="left", on=key_names, sort=False)
+        return [None if is_blank or pd.isna(row_id) else int(row_id) for row_id, is_blank in zip(aligned["row id"].tolist(), blank.tolist())]
+    def _changed_cells(self, frame, row_ids, titles, changed_only):
+        '''{frame row position: {title: new value}} for the matched rows (row_ids[i] is not None), built one column at a time
+        changed_only compares each value with the sheet's raw cell (formula, else value) and keeps the ones that differ (see _diff_key)'''
+        column_types = dict(zip(self.column_df["title"], self.column_df["type"]))
+        matched = [(i, row_id) for i, row_id in enumerate(row_ids) if row_id is not None]
+        changes = {}
+        for title in titles:
+            column = frame[title]
+            values = column.astype(object).where(column.notna(), None).tolist()
+            column_type = column_types.get(title)
+            old = self._raw_column(int(self.column_id_dict[title])) if changed_only else {}
+            for i, row_id in matched:
+                value = values[i]
+                if changed_only:
+                    current = old.get(row_id, (None,))
+                    if value in current:
+                        continue
+                    new_key = self._diff_key(value, column_type)
+                    if any(new_key == self._diff_key(old_value, column_type) for old_value in current):
+                        continue
+                changes.setdefault(i, {})[title] = value
+        return changes
+    def _raw_column(self, column_id):
+        '''{row id: what the cell holds} for one column of the last full fetch (grid_content), as a tuple of its formula (if any),
+        value and display value (if any)'''
+        j = self.grid_column_ids.index(column_id)
+        values = {}
+        for row in (self.grid_content).get("rows") or []:
+            cells = row.get("cells")
+            if j < len(cells) and cells[j].get("columnId") == column_id:
+                cell = cells[j]
+            else:
+                cell = next((cell for cell in cells if cell.get("columnId") == column_id), {})
+            values[row.get("id")] = tuple(cell[name] for name in ("formula", "value", "displayValue") if name in cell) or (None,)
+        return values
     #endregion
-#endregion
\ No newline at end of file
+#endregion
+
+
+class AsyncGrid:
+    '''asyncio face of grid for services/schedulers juggling many sheets from one event loop
+    each method runs the matching grid method on one process wide thread pool (max_workers), so the awaiting task yields
+    while the request is out and the event loop never blocks. every AsyncGrid shares grid's pooled sdk client, rate limiter and
+    schema/summary caches, and the DataFrames and payloads come out of the same grid code, so both APIs behave the same
+    calls on one AsyncGrid run one at a time (they share its df/row state, and smartsheet only applies one write per sheet at once),
+    calls on different AsyncGrids run concurrently
+    cancelling an await stops the waiting, not the request already running on the pool
+
+    async_grid = AsyncGrid(sheet_id)                 # same arguments as grid(...)
+    await async_grid.fetch_content()
+    async_grid.df                                    # attributes are read straight off the wrapped grid (.sync)
+    async for page_df in async_grid.iter_content(page_size=5000): ...
+    async with async_grid.journaled("nightly load"): ...
+    dfs, summary_dfs, errors = await AsyncGrid.fetch_many(sheet_ids)
+    grid methods without an async version here raise AttributeError instead of blocking the loop, except the local_methods
+    that never touch the network (call anything else on .sync from a thread if you really need it)'''
+
+    max_workers = 16
+    # grid methods that are safe to call straight from the event loop
+    local_methods = frozenset({"reduce_columns", "is_date_like", "parse_to_iso8601", "key_normalizer"})
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, grid_id, **grid_kwargs):
+        self.sync = grid(grid_id, **grid_kwargs)
+        self._lock = None
+
+    def __getattr__(self, name):
+        if name == "sync":
+            # not set up yet (copy/pickle), don't recurse
+            raise AttributeError(name)
+        if name not in self.local_methods and isinstance(vars(grid).get(name), (types.FunctionType, classmethod, staticmethod)):
+            raise AttributeError(f"AsyncGrid has no async {name}(), grid.{name} would block the event loop (call it on .sync from a thread)")
+        return getattr(self.sync, name)
+
+    @classmethod
+    def _pool(cls):
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix="AsyncGrid")
+            return cls._executor
+
+    async def _call(self, name, *args, **kwargs):
+        '''awaits grid.<name>(*args, **kwargs) on the shared pool, one call per AsyncGrid at a time'''
+        return await self._run(getattr(self.sync, name), *args, **kwargs)
+
+    async def _run(self, func, *args, **kwargs):
+        if self._lock is None:
+            # made here rather than in __init__ so it belongs to the loop that uses it
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(AsyncGrid._pool(), functools.partial(func, *args, **kwargs))
+
+    @asynccontextmanager
+    async def _entered(self, manager):
+        '''async with over one of grid's context managers, entering and leaving it on the pool'''
+        await self._run(manager.__enter__)
+        try:
+            yield self
+        except BaseException:
+            if not await self._run(manager.__exit__, *sys.exc_info()):
+                raise
+        else:
+            await self._run(manager.__exit__, None, None, None)
+
+    async def get_column_df(self, refresh=False):
+        return await self._call("get_column_df", refresh=refresh)
+
+    async def fetch_content(self, incremental=None, typed=None, page_size=None, columns=None, row_ids=None, filter_id=None):
+        return await self._call("fetch_content", incremental=incremental, typed=typed, page_size=page_size,
+                                columns=columns, row_ids=row_ids, filter_id=filter_id)
+
+    async def iter_content(self, page_size=5000, typed=None):
+        '''async generator version of grid.iter_content, each page is pulled on the pool'''
+        pages = self.sync.iter_content(page_size=page_size, typed=typed)
+        done = object()
+        try:
+            while True:
+                page_df = await self._run(next, pages, done)
+                if page_df is done:
+                    return
+                yield page_df
+        finally:
+            pages.close()
+
+    async def sync_content(self, typed=None):
+        return await self._call("sync_content", typed=typed)
+
+    async def fetch_row_ids(self):
+        return await self._call("fetch_row_ids")
+
+    async def fetch_summary_content(self):
+        return await self._call("fetch_summary_content")
+
+    async def delete_all_rows(self):
+        return await self._call("delete_all_rows")
+
+    async def post_new_rows(self, posting_data, post_fresh=False, post_to_top=False):
+        return await self._call("post_new_rows", posting_data, post_fresh=post_fresh, post_to_top=post_to_top)
+
+    async def update_rows(self, posting_data, primary_key, update_type='default'):
+        return await self._call("update_rows", posting_data, primary_key, update_type=update_type)
+
+    async def write_dataframe(self, df, key=None, mode='upsert', changed_only=True):
+        return await self._call("write_dataframe", df, key=key, mode=mode, changed_only=changed_only)
+
+    async def post_to_summary_field(self, sum_id, post):
+        return await self._call("post_to_summary_field", sum_id, post)
+
+    async def grabrcreate_sum_id(self, field_name_str, sum_type):
+        return await self._call("grabrcreate_sum_id", field_name_str, sum_type)
+
+    async def handle_update_stamps(self):
+        return await self._call("handle_update_stamps")
+
+    async def grab_posting_column_ids(self, filtered_column_title_list="all_columns"):
+        return await self._call("grab_posting_column_ids", filtered_column_title_list)
+
+    async def grab_posting_row_ids(self, posting_data, primary_key, skip_nonmatch=False, fetch=None, normalize=None):
+        return await self._call("grab_posting_row_ids", posting_data, primary_key, skip_nonmatch=skip_nonmatch, fetch=fetch, normalize=normalize)
+
+    async def key_index(self, primary_key, normalize=None, fetch=None):
+        return await self._call("key_index", primary_key, normalize=normalize, fetch=fetch)
+
+    def deferred_stamps(self):
+        '''async with async_grid.deferred_stamps(): ... (see grid.deferred_stamps), the closing stamp is written on the pool'''
+        return self._entered(self.sync.deferred_stamps())
+
+    def journaled(self, job_id, path=None):
+        '''async with async_grid.journaled(job_id): ... (see grid.journaled), the journal is opened and closed on the pool'''
+        return self._entered(self.sync.journaled(job_id, path))
+
+    @classmethod
+    async def fetch_many(cls, sheet_ids, summaries=False, **grid_kwargs):
+        '''async grid.fetch_many: every sheet (and summary) is its own task, returns (dfs, summary_dfs, errors) the same way
+        grid_kwargs go to each AsyncGrid (token, typed, incremental, snapshot_dir, etc...)'''
+        async def content(sheet_id):
+            sheet = cls(sheet_id, **grid_kwargs)
+            await sheet.fetch_content()
+            return sheet.df
+        async def summary(sheet_id):
+            sheet = cls(sheet_id, **grid_kwargs)
+            await sheet.fetch_summary_content()
+            return sheet.summary_df
+
+        tasks = [(sheet_id, "content", content(sheet_id)) for sheet_id in sheet_ids]
+        if summaries:
+            tasks += [(sheet_id, "summary", summary(sheet_id)) for sheet_id in sheet_ids]
+        results = await asyncio.gather(*(task for sheet_id, kind, task in tasks), return_exceptions=True)
+        dfs, summary_dfs, errors = {}, {}, {}
+        for (sheet_id, kind, task), result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                errors.setdefault(sheet_id, {})[kind] = result
+            else:
+                (dfs if kind == "content" else summary_dfs)[sheet_id] = result
+        return dfs, summary_dfs, errors
\ No newline at end of file
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / "benchmarks"))
+import grid as grid_module
+from grid import grid
+import fake_smartsheet
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    '''a fresh benchmarks/fake_smartsheet.py (50 x 8 sheets) on a free port, grid pointed at it with its shared caches emptied'''
+    server, api = fake_smartsheet.start(rows=50, columns=8)
+    monkeypatch.setattr(grid, "api_base", f"http://127.0.0.1:{server.server_address[1]}/2.0")
+    monkeypatch.setattr(grid, "_rate_limiter", grid_module._RateLimiter(100000))
+    monkeypatch.setattr(grid, "_clients", {})
+    monkeypatch.setattr(grid, "_schema_cache", {})
+    monkeypatch.setattr(grid, "_summary_field_ids", {})
+    yield api
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sheet(fake):
+    return grid(1, token="test")
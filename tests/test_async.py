@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from grid import AsyncGrid, grid
+
+
+def test_fetch_content(fake):
+    async_grid = AsyncGrid(1, token="test")
+    asyncio.run(async_grid.fetch_content())
+    full = grid(1, token="test")
+    full.fetch_content()
+    assert async_grid.df.equals(full.df)
+
+
+def test_iter_content_pages(fake):
+    async def pages():
+        return [page_df async for page_df in AsyncGrid(1, token="test").iter_content(page_size=20)]
+
+    assert [len(page_df) for page_df in asyncio.run(pages())] == [20, 20, 10]
+
+
+def test_journaled_block(fake, tmp_path):
+    async def job():
+        async_grid = AsyncGrid(1, token="test")
+        async with async_grid.journaled("async load", path=tmp_path / "journal.sqlite3"):
+            await async_grid.post_new_rows([{"Key": "async-1"}, {"Key": "async-2"}])
+        return async_grid.journal_report
+
+    assert asyncio.run(job())["chunks_sent"] == 1
+    assert [row["cells"][0]["value"] for row in fake.sheet(1).rows[-2:]] == ["async-1", "async-2"]
+
+
+def test_fetch_many(fake):
+    dfs, summary_dfs, errors = asyncio.run(AsyncGrid.fetch_many([1, 2], token="test"))
+    assert sorted(dfs) == [1, 2] and not errors
+    assert len(dfs[2]) == 50
+
+
+def test_blocking_methods_are_not_forwarded(fake):
+    async_grid = AsyncGrid(1, token="test")
+    with pytest.raises(AttributeError):
+        async_grid._get_sheet_json()
+    # plain attributes and local helpers still come off the wrapped grid
+    assert async_grid.grid_id == 1
+    assert async_grid.is_date_like("2024-01-02")
@@ -0,0 +1,99 @@
+import pytest
+
+from grid import grid
+
+
+def test_fresh_instance_reads_columns(sheet):
+    column_df = sheet.get_column_df()
+    assert list(column_df["title"][:2]) == ["Key", "col 1"]
+    # the fake's formula column comes back as formula text, like the api sends it
+    assert column_df.loc[column_df["title"] == "col 5", "formula"].iloc[0] == "=[col 4]@row * 2"
+
+
+def test_fetch_content(sheet, fake):
+    sheet.fetch_content()
+    assert len(sheet.df) == 50
+    assert list(sheet.df.columns) == [column["title"] for column in fake.sheet(1).columns] + ["id"]
+    assert sheet.grid_row_ids == [row["id"] for row in fake.sheet(1).rows]
+
+
+def test_post_new_rows_on_fresh_instance(sheet, fake):
+    sheet.post_new_rows([{"Key": "new-1", "col 1": "a"}, {"Key": "new-2", "col 1": "b"}])
+    assert [row["cells"][0]["value"] for row in fake.sheet(1).rows[-2:]] == ["new-1", "new-2"]
+
+
+def test_sync_merges_changes(fake):
+    incremental = grid(1, token="test", incremental=True)
+    incremental.fetch_content()
+    fake_sheet = fake.sheet(1)
+    edited, deleted = fake_sheet.rows[3]["id"], fake_sheet.rows[7]["id"]
+    fake_sheet.update_rows([{"id": edited, "cells": [{"columnId": fake_sheet.columns[1]["id"], "value": "edited"}]}])
+    fake_sheet.delete_rows([deleted])
+    fake_sheet.add_rows([{"cells": [{"columnId": fake_sheet.columns[0]["id"], "value": "added"}]}])
+
+    incremental.fetch_content()
+    full = grid(1, token="test")
+    full.fetch_content()
+    assert incremental.grid_row_ids == full.grid_row_ids
+    assert incremental.df.equals(full.df)
+    assert incremental.df.loc[incremental.df["id"] == edited, "col 1"].iloc[0] == "edited"
+
+
+def test_fetch_keeps_column_df_from_get_columns(sheet, fake):
+    sheet.fetch_content()
+    # the get sheet response's columns only fill the title index, column_df is get_columns' (level 2, objectValue)
+    assert fake.stats()["requests"].get("get_columns 200") == 1
+    assert sheet.column_df.equals(sheet.get_column_df(refresh=True))
+    sheet.grab_posting_column_ids(["Key", "col 1"])
+    assert fake.stats()["requests"].get("get_columns 200") == 2
+
+
+@pytest.mark.parametrize("page_size", [None, 20])
+def test_fetch_filter_id(sheet, fake, page_size):
+    # col 2 is a picklist column, the filter shows the rows that are Done
+    fake.sheet(1).filters[9] = lambda row: row["cells"][2]["value"] == "Done"
+    sheet.fetch_content(filter_id=9, page_size=page_size)
+    full = grid(1, token="test")
+    full.fetch_content()
+    done = full.df[full.df["col 2"] == "Done"].reset_index(drop=True)
+    assert 0 < len(sheet.df) < len(full.df)
+    assert sheet.df.equals(done)
+    assert sheet.grid_row_ids == done["id"].tolist() and sheet.partial_content
+
+
+def test_typed_pages_match_full_fetch(fake):
+    fake_sheet = fake.sheet(1)
+    # col 4 is numbers except one text cell on the last page
+    fake_sheet.update_rows([{"id": fake_sheet.rows[45]["id"], "cells": [{"columnId": fake_sheet.columns[4]["id"], "value": "x"}]}])
+    full = grid(1, token="test", typed=True)
+    full.fetch_content()
+    paged = grid(1, token="test", typed=True)
+    paged.fetch_content(page_size=20)
+    assert paged.df.equals(full.df)
+    assert paged.df["col 4"].tolist() == full.df["col 4"].tolist()
+
+
+def test_typed_sync_matches_full_fetch(fake):
+    incremental = grid(1, token="test", typed=True, incremental=True)
+    incremental.fetch_content()
+    fake_sheet = fake.sheet(1)
+    fake_sheet.update_rows([{"id": fake_sheet.rows[3]["id"], "cells": [{"columnId": fake_sheet.columns[4]["id"], "value": "x"}]}])
+    incremental.fetch_content()
+    full = grid(1, token="test", typed=True)
+    full.fetch_content()
+    assert incremental.df.equals(full.df)
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_snapshot_round_trip(fake, tmp_path, typed):
+    pytest.importorskip("pyarrow")
+    first = grid(1, token="test", typed=typed, snapshot_dir=tmp_path)
+    first.fetch_content()
+    # arrow files only, grid_rows is rebuilt instead of pickled
+    assert all(path.suffix in (".feather", ".json") for path in (tmp_path / "1").iterdir())
+
+    second = grid(1, token="test", typed=typed, snapshot_dir=tmp_path)
+    second.fetch_content()
+    assert fake.stats()["requests"]["get_sheet 200"] == 1
+    assert second.df.equals(first.df)
+    assert second.grid_rows == first.grid_rows
@@ -0,0 +1,162 @@
+import datetime
+
+import pytest
+
+import grid as grid_module
+from grid import grid
+
+
+def test_delete_retry_after_applied_chunk(sheet, fake, monkeypatch):
+    # the first delete goes through but answers 500, the retry finds its rows already gone
+    fake.faults[("delete_rows", 1)] = (500, True)
+    monkeypatch.setattr(grid_module.random, "uniform", lambda low, high: 0)
+    sheet.delete_chunk_rows = 20
+    sheet.delete_all_rows()
+    assert fake.sheet(1).rows == []
+    assert sheet.call_stats["delete_rows"]["retries"] == 1
+
+
+def test_post_new_rows_keeps_order(sheet, fake):
+    fake.latency = 0.01
+    sheet.max_workers = 4
+    sheet.max_chunk_rows = 20
+    sheet.post_new_rows([{"Key": f"bottom-{i}"} for i in range(100)])
+    assert [row["cells"][0].get("value") for row in fake.sheet(1).rows[-100:]] == [f"bottom-{i}" for i in range(100)]
+
+
+def test_post_to_top_keeps_order(sheet, fake):
+    sheet.max_chunk_rows = 20
+    sheet.post_new_rows([{"Key": f"top-{i}"} for i in range(100)], post_to_top=True)
+    assert [row["cells"][0].get("value") for row in fake.sheet(1).rows[:100]] == [f"top-{i}" for i in range(100)]
+
+
+def test_resume_post_fresh(sheet, fake, tmp_path):
+    posting_data = [{"Key": f"fresh-{i}"} for i in range(100)]
+    sheet.max_chunk_rows = 20
+    # the third add chunk fails for good, the first two are on the sheet
+    fake.faults[("add_rows", 3)] = (400, False)
+    with pytest.raises(Exception):
+        with sheet.journaled("reload", path=tmp_path / "journal.sqlite3"):
+            sheet.post_new_rows(posting_data, post_fresh=True)
+    assert len(fake.sheet(1).rows) == 40
+
+    with sheet.journaled("reload", path=tmp_path / "journal.sqlite3"):
+        sheet.post_new_rows(posting_data, post_fresh=True)
+    assert [row["cells"][0].get("value") for row in fake.sheet(1).rows] == [f"fresh-{i}" for i in range(100)]
+    assert sheet.journal_report["chunks_skipped"] == 3
+
+
+def test_diff_keeps_numeric_text_as_text(sheet, fake):
+    fake_sheet = fake.sheet(1)
+    column_id = fake_sheet.columns[4]["id"]
+    stored = ["1234", 1234, "12345678901234567", "1000"]
+    fake_sheet.update_rows([{"id": row["id"], "cells": [{"columnId": column_id, "value": value}]}
+                            for row, value in zip(fake_sheet.rows, stored)])
+    posted = ["01234", 1234.0, "12345678901234568", "1e3"]
+    summary = sheet.update_rows([{"Key": f"key-{i}", "col 4": value} for i, value in enumerate(posted)], "Key", update_type="diff")
+    changed = {fake_sheet.rows[i]["id"] for i in (0, 2, 3)}
+    assert set(summary["changes"]) == changed
+    assert [row["cells"][4]["value"] for row in fake_sheet.rows[:4]] == ["01234", 1234, "12345678901234568", "1e3"]
+
+
+def test_write_dataframe_after_snapshot(fake, tmp_path):
+    first = grid(1, token="test", snapshot_dir=tmp_path)
+    first.fetch_content()
+    edited = first.df.copy()
+    edited.loc[3, "col 4"] = "edited"
+
+    # a new instance puts the snapshot back, the write back still compares against the sheet's raw cells
+    second = grid(1, token="test", snapshot_dir=tmp_path)
+    summary = second.write_dataframe(edited, key="Key")
+    assert (summary["updated"], summary["cells_updated"]) == (1, 1)
+    assert fake.sheet(1).rows[3]["cells"][4]["value"] == "edited"
+
+
+def test_journal_sends_repeated_writes(sheet, fake, tmp_path):
+    first, second = [{"Key": "key-0", "col 4": "a"}], [{"Key": "key-0", "col 4": "b"}]
+    with sheet.journaled("repeat", path=tmp_path / "journal.sqlite3"):
+        sheet.update_rows(first, "Key", update_type="batch")
+        sheet.update_rows(second, "Key", update_type="batch")
+        sheet.update_rows(first, "Key", update_type="batch")
+        sheet.post_new_rows([{"Key": "twice"}])
+        sheet.post_new_rows([{"Key": "twice"}])
+    assert fake.sheet(1).rows[0]["cells"][4]["value"] == "a"
+    assert [row["cells"][0].get("value") for row in fake.sheet(1).rows[-2:]] == ["twice", "twice"]
+    assert sheet.journal_report["chunks_skipped"] == 0
+
+
+def test_journal_resumes_repeated_writes(sheet, fake, tmp_path):
+    first, second = [{"Key": "key-0", "col 4": "a"}], [{"Key": "key-0", "col 4": "b"}]
+
+    def job():
+        with sheet.journaled("repeat", path=tmp_path / "journal.sqlite3"):
+            sheet.update_rows(first, "Key", update_type="batch")
+            sheet.update_rows(second, "Key", update_type="batch")
+            sheet.update_rows(first, "Key", update_type="batch")
+
+    fake.faults[("update_rows", 3)] = (400, False)
+    with pytest.raises(Exception):
+        job()
+    assert fake.sheet(1).rows[0]["cells"][4]["value"] == "b"
+    # the third write is the same payload as the first, it still has to go out
+    job()
+    assert fake.sheet(1).rows[0]["cells"][4]["value"] == "a"
+    assert sheet.journal_report["chunks_skipped"] == 2
+
+
+def test_upsert_after_failed_post_doesnt_duplicate(sheet, fake):
+    new_rows = [{"Key": f"new-{i}", "col 4": "x"} for i in range(15)]
+    sheet.max_chunk_rows = 5
+    fake.faults[("add_rows", 2)] = (400, False)
+    with pytest.raises(Exception):
+        sheet.update_rows(new_rows, "Key")
+    assert len(fake.sheet(1).rows) == 55
+
+    # the five rows the first chunk made are on the sheet now, the retry matches them instead of posting them again
+    sheet.update_rows(new_rows, "Key")
+    keys = [row["cells"][0].get("value") for row in fake.sheet(1).rows]
+    assert len(keys) == 65
+    assert sorted(keys[50:]) == sorted(f"new-{i}" for i in range(15))
+
+
+def test_composite_key(sheet, fake):
+    fake_sheet = fake.sheet(1)
+    option = fake_sheet.rows[0]["cells"][2]["value"]
+    other = next(value for value in fake_sheet.columns[2]["options"] if value != fake_sheet.rows[1]["cells"][2]["value"])
+    sheet.update_rows([{"Key": "key-0", "col 2": option, "col 4": "both match"}, {"Key": "key-1", "col 2": other, "col 4": "one matches"}],
+                      ["Key", "col 2"])
+    assert fake_sheet.rows[0]["cells"][4]["value"] == "both match"
+    assert fake_sheet.rows[1]["cells"][4].get("value") != "one matches"
+    assert [row["cells"][4]["value"] for row in fake_sheet.rows[50:]] == ["one matches"]
+
+
+def test_key_normalization(sheet, fake):
+    fake_sheet = fake.sheet(1)
+    fake_sheet.update_rows([{"id": fake_sheet.rows[0]["id"], "cells": [{"columnId": fake_sheet.columns[4]["id"], "value": 5},
+                                                                       {"columnId": fake_sheet.columns[1]["id"], "value": "2030-01-02"}]}])
+    # numbers match however they are written, dates match as dates
+    for value in (5, 5.0, " 5 ", "5"):
+        sheet.update_rows([{"col 4": value, "col 3": True}], "col 4")
+    for value in (datetime.date(2030, 1, 2), "2030-01-02T00:00:00", " 2030-01-02 "):
+        sheet.update_rows([{"col 1": value, "col 4": 5}], "col 1")
+    assert len(fake_sheet.rows) == 50
+    assert fake_sheet.rows[0]["cells"][3]["value"] is True
+    # text that only looks like a number is still text
+    assert "05" not in sheet.key_index("col 4") and "5" in sheet.key_index("col 4")
+
+
+def test_duplicate_keys(sheet, fake):
+    fake_sheet = fake.sheet(1)
+    first, second = fake_sheet.rows[0]["id"], fake_sheet.rows[1]["id"]
+    fake_sheet.update_rows([{"id": second, "cells": [{"columnId": fake_sheet.columns[0]["id"], "value": "key-0"}]}])
+    sheet.update_rows([{"Key": "key-0", "col 4": "first of them"}], "Key")
+    assert sheet.duplicate_keys == {"key-0": [first, second]}
+    assert fake_sheet.rows[0]["cells"][4]["value"] == "first of them"
+    assert fake_sheet.rows[1]["cells"][4].get("value") != "first of them"
+
+
+def test_write_dataframe_append_with_key(sheet, fake):
+    sheet.fetch_content()
+    summary = sheet.write_dataframe(sheet.df.iloc[:3], key="Key", mode="append")
+    assert summary["added"] == 3 and summary["updated"] == 0
+    assert [row["cells"][0]["value"] for row in fake.sheet(1).rows[50:]] == ["key-0", "key-1", "key-2"]